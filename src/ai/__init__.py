@@ -0,0 +1,15 @@
+"""
+ML Extractor AI Module
+Optional AI enrichment behind the ENABLE_AI feature flag.
+"""
+
+from .backends import Backend, BackendError, HTTPBackend, StubBackend
+from .cache import ResponseCache
+from .client import EnrichmentClient
+from .enrich import default_ai_client, enrich_frame_ai, enrich_records, is_ai_enabled
+
+__all__ = [
+    'Backend', 'BackendError', 'HTTPBackend', 'StubBackend',
+    'ResponseCache', 'EnrichmentClient', 'default_ai_client', 'enrich_frame_ai',
+    'enrich_records', 'is_ai_enabled',
+]
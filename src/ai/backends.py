@@ -0,0 +1,118 @@
+"""
+AI Backend Module
+Pluggable model backends used by the enrichment client.
+
+Every backend receives a batch of prompts and returns one completion per
+prompt, in the same order. Packing many rows into a single request is what
+keeps large catalogs affordable.
+"""
+
+import asyncio
+import hashlib
+import json
+import urllib.error
+import urllib.request
+
+
+class BackendError(Exception):
+    """Raised when a backend request fails and may be retried."""
+
+
+def stub_completion(prompt):
+    """
+    Deterministic completion used by the local stub backend and server.
+
+    The same prompt always yields the same text, so runs are reproducible
+    and cache behaviour can be measured offline.
+
+    Args:
+        prompt (str): Prompt text
+
+    Returns:
+        str: Completion in ``field: value`` lines
+    """
+    digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:8]
+    return f"description: Descripción generada {digest}"
+
+
+class Backend:
+    """Base class for model backends."""
+
+    name = "base"
+
+    async def complete(self, prompts):
+        """
+        Complete a batch of prompts.
+
+        Args:
+            prompts (list): Prompt strings
+
+        Returns:
+            list: One completion string per prompt
+        """
+        raise NotImplementedError
+
+
+class StubBackend(Backend):
+    """
+    In-process deterministic backend.
+
+    Args:
+        latency (float): Simulated seconds per request
+        fail_every (int): If set, every Nth request raises BackendError (for retry tests)
+    """
+
+    name = "stub-v1"
+
+    def __init__(self, latency=0.0, fail_every=None):
+        self.latency = latency
+        self.fail_every = fail_every
+        self.requests = 0
+
+    async def complete(self, prompts):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail_every and self.requests % self.fail_every == 0:
+            raise BackendError("stub backend simulated failure")
+        return [stub_completion(p) for p in prompts]
+
+
+class HTTPBackend(Backend):
+    """
+    Backend speaking the batch JSON protocol of ``src.ai.stub_server``.
+
+    Request body: ``{"model": ..., "prompts": [...]}``
+    Response body: ``{"completions": [...]}``
+
+    Args:
+        url (str): Endpoint URL
+        model (str): Model name sent with each request
+        timeout (float): Per-request timeout in seconds
+    """
+
+    def __init__(self, url, model="stub-v1", timeout=30.0):
+        self.url = url
+        self.name = model
+        self.timeout = timeout
+        self.requests = 0
+
+    def _post(self, prompts):
+        body = json.dumps({'model': self.name, 'prompts': prompts}).encode('utf-8')
+        request = urllib.request.Request(
+            self.url, data=body, headers={'Content-Type': 'application/json'}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = json.loads(response.read().decode('utf-8'))
+        except (urllib.error.URLError, OSError, ValueError) as exc:
+            raise BackendError(str(exc)) from exc
+
+        completions = payload.get('completions')
+        if not isinstance(completions, list) or len(completions) != len(prompts):
+            raise BackendError("malformed batch response")
+        return completions
+
+    async def complete(self, prompts):
+        self.requests += 1
+        return await asyncio.to_thread(self._post, prompts)
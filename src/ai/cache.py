@@ -0,0 +1,90 @@
+"""
+AI Response Cache Module
+Stores model responses on disk keyed by a hash of the prompt.
+"""
+
+import hashlib
+import json
+import os
+
+
+def prompt_key(prompt, model=None):
+    """
+    Build the cache key for a prompt.
+
+    Args:
+        prompt (str): Prompt text sent to the model
+        model (str): Model/backend identifier, so different models never share entries
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update((model or "").encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(prompt.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    Disk cache of model responses, one JSON file per prompt hash.
+
+    The key covers model + prompt. When ``model`` is left as None,
+    EnrichmentClient fills in its backend's name.
+
+    Files are sharded by the first two hex characters of the key so a
+    large catalog does not put every entry in a single directory.
+    """
+
+    def __init__(self, directory, model=None):
+        self.directory = directory
+        self.model = model
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def get(self, prompt):
+        """
+        Look up a cached response.
+
+        Args:
+            prompt (str): Prompt text
+
+        Returns:
+            str: Cached response, or None if not cached
+        """
+        path = self._path(prompt_key(prompt, self.model))
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                response = json.load(f)['response']
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return response
+
+    def put(self, prompt, response):
+        """
+        Store a response for a prompt.
+
+        The entry is written to a temporary file and renamed into place so
+        concurrent readers never see a partial file.
+
+        Args:
+            prompt (str): Prompt text
+            response (str): Model response
+        """
+        path = self._path(prompt_key(prompt, self.model))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'response': response}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -0,0 +1,155 @@
+"""
+AI Enrichment Client Module
+Batched, deduplicated and cached access to a model backend.
+"""
+
+import asyncio
+import concurrent.futures
+import time
+
+from .backends import BackendError
+
+
+class RateLimiter:
+    """
+    Spaces request starts so no more than ``rate`` requests begin per second.
+
+    Args:
+        rate (float): Requests per second, or None for no limit
+    """
+
+    def __init__(self, rate=None):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class EnrichmentClient:
+    """
+    Sends prompts to a backend efficiently.
+
+    Identical prompts are sent once, cached responses are reused, and the
+    remaining prompts are packed into batches that run concurrently under a
+    bounded semaphore with rate limiting and retries.
+
+    Args:
+        backend: Backend instance (see ``src.ai.backends``)
+        cache: Optional ResponseCache; keyed by the backend name unless it
+            was created with an explicit model
+        batch_size (int): Prompts per backend request
+        max_concurrency (int): Maximum requests in flight
+        rate_limit (float): Maximum requests started per second, None for unlimited
+        max_retries (int): Retries per batch after the first attempt
+        backoff (float): Initial retry delay in seconds, doubled per attempt
+    """
+
+    def __init__(self, backend, cache=None, batch_size=20, max_concurrency=4,
+                 rate_limit=None, max_retries=3, backoff=0.5):
+        self.backend = backend
+        self.cache = cache
+        if cache is not None and cache.model is None:
+            cache.model = getattr(backend, 'name', None)
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.stats = {
+            'prompts': 0,
+            'unique': 0,
+            'cache_hits': 0,
+            'requests': 0,
+            'retries': 0,
+            'failed': 0,
+        }
+
+    async def _send_batch(self, batch, semaphore, limiter):
+        attempt = 0
+        while True:
+            async with semaphore:
+                await limiter.acquire()
+                self.stats['requests'] += 1
+                try:
+                    return await self.backend.complete(batch)
+                except BackendError:
+                    if attempt >= self.max_retries:
+                        self.stats['failed'] += len(batch)
+                        return [None] * len(batch)
+            self.stats['retries'] += 1
+            await asyncio.sleep(self.backoff * (2 ** attempt))
+            attempt += 1
+
+    async def complete(self, prompts):
+        """
+        Complete a list of prompts.
+
+        Args:
+            prompts (list): Prompt strings, duplicates allowed
+
+        Returns:
+            list: One response per input prompt; None where the backend
+            failed after all retries
+        """
+        prompts = list(prompts)
+        self.stats['prompts'] += len(prompts)
+
+        unique = list(dict.fromkeys(prompts))
+        self.stats['unique'] += len(unique)
+
+        responses = {}
+        pending = []
+        for prompt in unique:
+            cached = self.cache.get(prompt) if self.cache is not None else None
+            if cached is not None:
+                responses[prompt] = cached
+                self.stats['cache_hits'] += 1
+            else:
+                pending.append(prompt)
+
+        batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limiter = RateLimiter(self.rate_limit)
+        results = await asyncio.gather(*(self._send_batch(b, semaphore, limiter) for b in batches))
+
+        for batch, completions in zip(batches, results):
+            for prompt, completion in zip(batch, completions):
+                responses[prompt] = completion
+                if completion is not None and self.cache is not None:
+                    self.cache.put(prompt, completion)
+
+        return [responses[p] for p in prompts]
+
+    def complete_sync(self, prompts):
+        """
+        Blocking wrapper around ``complete`` for non-async callers.
+
+        Safe to call from code that runs inside an event loop (the loop is
+        blocked until the prompts are done); async callers should await
+        ``complete`` instead.
+        """
+        return run_sync(self.complete(prompts))
+
+
+def run_sync(coro):
+    """
+    Run a coroutine to completion and return its result.
+
+    asyncio.run() refuses to start inside a running event loop, so in that
+    case the coroutine runs on a fresh loop in a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
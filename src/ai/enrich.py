@@ -0,0 +1,229 @@
+"""
+AI Enrichment Stage
+Builds prompts from product rows, sends them through an EnrichmentClient
+and merges the parsed answers back into the rows.
+
+Disabled unless ENABLE_AI=1 (or enable_ai=True is passed); otherwise
+records are returned unchanged and no backend is contacted. apply_mapping()
+and run_pipeline() call enrich_frame_ai() after the deterministic
+enrichment, using the backend configured by:
+    ML_EXTRACTOR_AI_URL=http://host:port/v1/batch
+    ML_EXTRACTOR_AI_MODEL=model-name   (optional, default stub-v1)
+    ML_EXTRACTOR_AI_CACHE=/path/to/cache   (optional)
+"""
+
+import json
+import os
+
+import pandas as pd
+
+from .backends import HTTPBackend
+from .cache import ResponseCache
+from .client import EnrichmentClient, run_sync
+
+# Only these fields go into the prompt. Row-specific values such as SKU,
+# price or stock are left out so repeated products produce identical
+# prompts and are sent to the model once.
+PROMPT_FIELDS = [
+    'title', 'titulo', 'brand', 'marca', 'category', 'categoria',
+    'description', 'descripcion', 'color', 'material', 'weight', 'weight_unit',
+]
+
+# Output fields each mode is allowed to write.
+MODE_FIELDS = {
+    'description': {'description'},
+    'attributes': {'color', 'material', 'brand'},
+    'title_normalization': {'title'},
+}
+
+# Fields that may be rewritten even if already filled.
+OVERWRITABLE_FIELDS = {'title'}
+
+SYSTEM_PROMPT = (
+    "You enrich MercadoLibre product row data.\n"
+    "NEVER invent: category_id, price, SKU, regulatory codes.\n"
+    "Locale target: {locale}\n"
+    "Modes active: {modes}\n"
+    "Return ONLY enriched text values (UTF-8).\n"
+    "If a field should remain unchanged, do not output it."
+)
+
+
+def is_ai_enabled(enable_ai=None):
+    """
+    Resolve the AI feature flag.
+
+    Args:
+        enable_ai (bool): Explicit override; None reads the ENABLE_AI env var
+
+    Returns:
+        bool: True if AI enrichment should run
+    """
+    if enable_ai is not None:
+        return bool(enable_ai)
+    return os.environ.get('ENABLE_AI') == '1'
+
+
+def default_ai_client():
+    """EnrichmentClient configured from ML_EXTRACTOR_AI_URL, or None when unset."""
+    url = os.environ.get('ML_EXTRACTOR_AI_URL')
+    if not url:
+        return None
+    backend = HTTPBackend(url, model=os.environ.get('ML_EXTRACTOR_AI_MODEL', 'stub-v1'))
+    cache_dir = os.environ.get('ML_EXTRACTOR_AI_CACHE')
+    return EnrichmentClient(backend, cache=ResponseCache(cache_dir) if cache_dir else None)
+
+
+def build_prompt(record, locale, modes):
+    """
+    Build the prompt for one record.
+
+    Args:
+        record (dict): Product data dictionary
+        locale (str): Target locale, e.g. 'es-AR'
+        modes (set): Requested enrichment modes
+
+    Returns:
+        str: Prompt text
+    """
+    fields = {}
+    for field in PROMPT_FIELDS:
+        value = record.get(field)
+        if value is not None and value != "":
+            fields[field] = str(value)
+
+    modes_list = ", ".join(sorted(modes))
+    return "\n".join([
+        SYSTEM_PROMPT.format(locale=locale, modes=modes_list),
+        "Existing fields:",
+        json.dumps(fields, ensure_ascii=False, sort_keys=True, separators=(',', ':')),
+        "Requested enrichments:",
+        modes_list,
+    ])
+
+
+def parse_response(text, modes):
+    """
+    Parse ``field: value`` lines from a model response.
+
+    Lines naming fields outside the requested modes are rejected.
+
+    Args:
+        text (str): Model response
+        modes (set): Requested enrichment modes
+
+    Returns:
+        dict: Accepted field values
+    """
+    allowed = set()
+    for mode in modes:
+        allowed |= MODE_FIELDS.get(mode, set())
+
+    values = {}
+    for line in (text or "").splitlines():
+        field, sep, value = line.partition(':')
+        field = field.strip().lower()
+        value = value.strip()
+        if sep and field in allowed and value:
+            values[field] = value
+    return values
+
+
+def _merge(record, values, locale, model):
+    enriched = record.copy()
+    meta = dict(enriched.get('_meta') or {})
+    chain = list(meta.get('enrich_chain') or [])
+
+    modified = []
+    for field, value in values.items():
+        if enriched.get(field) and field not in OVERWRITABLE_FIELDS:
+            continue
+        enriched[field] = value
+        modified.append(field)
+        chain.append({'field': field, 'method': 'ai', 'source': 'model'})
+
+    meta['ai'] = {'fields_modified': modified, 'model': model, 'locale': locale}
+    meta['enrich_chain'] = chain
+    enriched['_meta'] = meta
+    return enriched
+
+
+def _mark_failed(record, locale, model):
+    enriched = record.copy()
+    meta = dict(enriched.get('_meta') or {})
+    meta['ai'] = {'method': 'ai_failed', 'fields_modified': [], 'model': model, 'locale': locale}
+    enriched['_meta'] = meta
+    return enriched
+
+
+async def enrich_records(records, client, locale='es-AR', modes=('description',), enable_ai=None):
+    """
+    Enrich a list of records through the AI client.
+
+    Args:
+        records (list): Product data dictionaries
+        client: EnrichmentClient instance
+        locale (str): Target locale
+        modes (iterable): Enrichment modes ('description', 'attributes', 'title_normalization')
+        enable_ai (bool): Feature flag override; None reads ENABLE_AI
+
+    Returns:
+        list: Enriched copies of the records, in input order
+    """
+    records = list(records)
+    if not is_ai_enabled(enable_ai):
+        return records
+
+    modes = set(modes)
+    model = getattr(client.backend, 'name', 'unknown')
+    prompts = [build_prompt(record, locale, modes) for record in records]
+    responses = await client.complete(prompts)
+
+    enriched = []
+    for record, response in zip(records, responses):
+        if response is None:
+            enriched.append(_mark_failed(record, locale, model))
+        else:
+            enriched.append(_merge(record, parse_response(response, modes), locale, model))
+    return enriched
+
+
+def enrich_frame_ai(df, client=None, locale='es-AR', modes=('description',), enable_ai=None):
+    """
+    Run the AI stage over an enriched DataFrame.
+
+    Args:
+        df (DataFrame): Output of enrich_frame()
+        client: EnrichmentClient; None uses default_ai_client()
+        locale (str): Target locale
+        modes (iterable): Enrichment modes
+        enable_ai (bool): Feature flag override; None reads ENABLE_AI
+
+    Returns:
+        DataFrame: ``df`` itself when the stage is disabled or no backend is
+        configured, else a copy with the fields the model filled
+    """
+    if not is_ai_enabled(enable_ai) or len(df) == 0:
+        return df
+    if client is None:
+        client = default_ai_client()
+        if client is None:
+            return df
+
+    # Missing cells are dropped so they count as empty, not as "nan".
+    records = [
+        {k: v for k, v in record.items() if not (pd.api.types.is_scalar(v) and pd.isna(v))}
+        for record in df.to_dict('records')
+    ]
+    enriched = run_sync(enrich_records(records, client, locale, modes, enable_ai=True))
+
+    modified = set()
+    for record in enriched:
+        modified.update(record['_meta']['ai']['fields_modified'])
+    if not modified:
+        return df
+
+    result = df.copy()
+    for field in sorted(modified):
+        result[field] = [record.get(field) for record in enriched]
+    return result
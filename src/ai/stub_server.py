@@ -0,0 +1,85 @@
+"""
+Local AI Stub Server
+Tiny HTTP server returning deterministic completions, so the enrichment
+client can be exercised and benchmarked without a real model.
+
+Usage:
+    python -m src.ai.stub_server --port 8765 --latency 0.05
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .backends import stub_completion
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            payload = json.loads(self.rfile.read(length).decode('utf-8'))
+            prompts = list(payload['prompts'])
+        except (ValueError, KeyError, TypeError):
+            self.send_error(400, "expected JSON body with 'prompts'")
+            return
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.server.requests += 1
+
+        body = json.dumps({'completions': [stub_completion(p) for p in prompts]}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(host='127.0.0.1', port=0, latency=0.0):
+    """
+    Start the stub server in a background thread.
+
+    Args:
+        host (str): Interface to bind
+        port (int): Port to bind, 0 picks a free one
+        latency (float): Simulated seconds per request
+
+    Returns:
+        tuple: (server, url); call ``server.shutdown()`` when done
+    """
+    server = ThreadingHTTPServer((host, port), _StubHandler)
+    server.latency = latency
+    server.requests = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://{host}:{server.server_address[1]}/v1/batch"
+    return server, url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deterministic AI stub server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), _StubHandler)
+    server.latency = args.latency
+    server.requests = 0
+    print(f"AI stub server listening on http://{args.host}:{args.port}/v1/batch")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+Streaming DOCX reader.
+
+Reads ``word/document.xml`` straight from the zip with incremental XML
+parsing instead of building python-docx's full object model. Paragraphs
+and table rows are yielded as soon as they are parsed and their elements
+are dropped, so memory stays flat regardless of document size. Supplier
+price lists kept as Word tables come out as DataFrame chunks ready for
+``apply_mapping``.
+"""
+
+import zipfile
+import xml.etree.ElementTree as ET
+
+import pandas as pd
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+P, T, TAB, BR, CR = W + "p", W + "t", W + "tab", W + "br", W + "cr"
+TBL, TR, TC, GRID_SPAN, VAL = W + "tbl", W + "tr", W + "tc", W + "gridSpan", W + "val"
+BODY = W + "body"
+TYPE = W + "type"
+
+
+def _paragraph_text(p):
+    parts = []
+    for el in p.iter():
+        if el.tag == T:
+            parts.append(el.text or "")
+        elif el.tag == TAB:
+            parts.append("\t")
+        elif el.tag == CR or (el.tag == BR and el.get(TYPE, "textWrapping") == "textWrapping"):
+            # Page and column breaks add no text, as in python-docx.
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _grid_span(tc):
+    span = tc.find(f"{W}tcPr/{GRID_SPAN}")
+    try:
+        return max(1, int(span.get(VAL))) if span is not None else 1
+    except (TypeError, ValueError):
+        return 1
+
+
+def iter_docx(file_path):
+    """
+    Stream the body of a DOCX file.
+
+    Yields:
+        tuple: ``("paragraph", text)`` for body paragraphs outside tables, and
+        ``("row", table_index, cells)`` for each row of a top-level table.
+        Nested tables are folded into the text of their enclosing cell;
+        horizontally merged cells repeat their text so columns line up.
+        Paragraphs that are not direct children of the body or a cell
+        (text boxes, content controls) are skipped, as in python-docx.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open("word/document.xml") as xml_file:
+            stack = []
+            table_depth = 0
+            table_index = 0
+            cells = []
+            cell_parts = []
+
+            for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+                if event == "start":
+                    stack.append(elem)
+                    if elem.tag == TBL:
+                        table_depth += 1
+                    continue
+
+                stack.pop()
+                parent = stack[-1] if stack else None
+
+                if elem.tag == P:
+                    # Only body and cell paragraphs count, as in python-docx.
+                    # Text boxes (w:txbxContent) are written twice by Word,
+                    # under mc:Choice and mc:Fallback, and are skipped.
+                    if parent is None or parent.tag not in (BODY, TC):
+                        pass
+                    elif table_depth == 0:
+                        yield ("paragraph", _paragraph_text(elem))
+                    else:
+                        cell_parts.append(_paragraph_text(elem))
+                elif elem.tag == TC and table_depth == 1:
+                    cells.extend(["\n".join(cell_parts)] * _grid_span(elem))
+                    cell_parts = []
+                elif elem.tag == TR and table_depth == 1:
+                    yield ("row", table_index, cells)
+                    cells = []
+                elif elem.tag == TBL:
+                    table_depth -= 1
+                    if table_depth == 0:
+                        table_index += 1
+
+                # Drop finished elements so the tree never grows; their text
+                # has been yielded or collected above.
+                if parent is not None and (elem.tag in (P, TC, TR, TBL) or parent.tag == BODY):
+                    parent.remove(elem)
+
+
+def iter_docx_paragraphs(file_path):
+    """Yield the text of each paragraph outside tables, in document order."""
+    for item in iter_docx(file_path):
+        if item[0] == "paragraph":
+            yield item[1]
+
+
+def _header_names(cells):
+    names = []
+    for i, cell in enumerate(cells):
+        name = cell.strip() or f"col_{i}"
+        if name in names:
+            name = f"{name}_{i}"
+        names.append(name)
+    return names
+
+
+def _frame(rows, columns, table_index):
+    width = len(columns)
+    rows = [(row + [""] * width)[:width] for row in rows]
+    df = pd.DataFrame(rows, columns=columns)
+    df.attrs["table_index"] = table_index
+    return df
+
+
+def iter_docx_tables(file_path, chunk_size=5000):
+    """
+    Yield the tables of a DOCX file as DataFrame chunks.
+
+    The first row of each table is used as its header. Each chunk carries
+    its source table number in ``df.attrs["table_index"]``.
+
+    Args:
+        file_path (str): DOCX file
+        chunk_size (int): Maximum rows per chunk
+
+    Yields:
+        DataFrame: Up to ``chunk_size`` rows of one table
+    """
+    columns = None
+    current = None
+    rows = []
+
+    for item in iter_docx(file_path):
+        if item[0] != "row":
+            continue
+        _, table_index, cells = item
+        if table_index != current:
+            if rows:
+                yield _frame(rows, columns, current)
+            current = table_index
+            columns = _header_names(cells)
+            rows = []
+            continue
+        rows.append(cells)
+        if len(rows) >= chunk_size:
+            yield _frame(rows, columns, current)
+            rows = []
+
+    if rows:
+        yield _frame(rows, columns, current)
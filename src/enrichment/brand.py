@@ -5,6 +5,9 @@ Provides brand detection and normalization functionality.
 
 import re
 
+# Fields searched for a brand, in priority order
+BRAND_FIELDS = ['brand', 'marca', 'fabricante', 'manufacturer', 'title', 'titulo']
+
 def enhance_brand(data):
     """
     Enhance brand information in product data.
@@ -18,10 +21,9 @@ def enhance_brand(data):
     enhanced_data = data.copy()
     
     # Look for brand in various fields
-    brand_fields = ['brand', 'marca', 'fabricante', 'manufacturer', 'title', 'titulo']
     brand_value = None
     
-    for field in brand_fields:
+    for field in BRAND_FIELDS:
         if field in data and data[field]:
             brand_value = str(data[field]).strip()
             break
@@ -36,6 +36,9 @@ COLOR_MAPPINGS = {
     'brown': 'brown'
 }
 
+# Fields searched for colors, in priority order
+COLOR_FIELDS = ['color', 'colour', 'title', 'titulo', 'description', 'descripcion', 'name', 'nombre']
+
 def enhance_color(data):
     """
     Enhance color information in product data.
@@ -49,10 +52,9 @@ def enhance_color(data):
     enhanced_data = data.copy()
     
     # Look for color in various fields
-    color_fields = ['color', 'colour', 'title', 'titulo', 'description', 'descripcion', 'name', 'nombre']
     detected_colors = []
     
-    for field in color_fields:
+    for field in COLOR_FIELDS:
         if field in data and data[field]:
             colors = extract_colors(str(data[field]))
             detected_colors.extend(colors)
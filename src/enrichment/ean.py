@@ -5,6 +5,9 @@ Provides EAN/barcode detection and validation functionality.
 
 import re
 
+# Fields searched for an EAN/barcode, in priority order
+EAN_FIELDS = ['ean', 'barcode', 'codigo_barras', 'upc', 'gtin', 'isbn', 'codigo', 'codigos', 'codigos_de_barra']
+
 def enhance_ean(data):
     """
     Enhance EAN/barcode information in product data.
@@ -18,9 +21,7 @@ def enhance_ean(data):
     enhanced_data = data.copy()
     
     # Look for EAN in various fields
-    ean_fields = ['ean', 'barcode', 'codigo_barras', 'upc', 'gtin', 'isbn', 'codigo', 'codigos', 'codigos_de_barra']
-    
-    for field in ean_fields:
+    for field in EAN_FIELDS:
         if field in data and data[field]:
             ean_value = extract_ean(str(data[field]))
             if ean_value:
@@ -0,0 +1,195 @@
+"""
+Frame Enrichment Module
+Applies the enrichment functions to a whole DataFrame.
+
+Supplier catalogs repeat the same brand, category, color phrase or weight
+spec across thousands of rows. Each input column is factorized and the
+extraction runs once per unique value; results are broadcast back to the
+rows through the integer codes, so work scales with cardinality instead of
+row count. Output matches apply_enrichments() applied row by row; color
+and weight unit columns written by enrichment are returned as categoricals.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .brand import BRAND_FIELDS, normalize_brand
+from .color import COLOR_FIELDS, extract_colors, get_spanish_color, normalize_color
+from .ean import EAN_FIELDS, extract_ean, validate_ean
+from .sku import SKU_FIELDS, generate_sku, normalize_sku
+from .weight import WEIGHT_FIELDS, extract_weight, get_spanish_unit
+
+
+def map_unique(values, func):
+    """
+    Apply a function once per distinct value and broadcast the results.
+
+    Missing values (NaN/None) are never passed to ``func`` and map to None.
+    Values of different types are kept apart even if they compare equal
+    (1, 1.0 and True stringify differently, so the row path may treat them
+    differently).
+
+    Args:
+        values: Series or array-like of hashable values
+        func (callable): Function of one value; may return None
+
+    Returns:
+        tuple: (results, found) arrays of row length; ``results`` is an
+        object array, ``found`` is True where the result is not None
+    """
+    if not isinstance(values, pd.Series):
+        values = pd.Series(values)
+    tagged = values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) not in ('string', 'empty')
+    if tagged:
+        # factorize hashes 1, 1.0 and True as one value: key on the type too.
+        values = pd.Series(
+            [v if pd.api.types.is_scalar(v) and pd.isna(v) else (type(v), v) for v in values],
+            dtype=object,
+        )
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    results = np.empty(len(uniques) + 1, dtype=object)
+    for i, value in enumerate(uniques):
+        results[i] = func(value[1] if tagged else value)
+    # The NA sentinel -1 picks the trailing None slot.
+    results[-1] = None
+    found = np.fromiter((r is not None for r in results), dtype=bool, count=len(results))
+    return results[codes], found[codes]
+
+
+def _first_match(df, fields, func):
+    """
+    Per row, the result of ``func`` on the first field where it is not None.
+
+    Fields are scanned in priority order like the row enrichers do.
+    """
+    result = np.full(len(df), None, dtype=object)
+    resolved = np.zeros(len(df), dtype=bool)
+    for field in fields:
+        if field not in df.columns or resolved.all():
+            continue
+        values, found = map_unique(df[field], func)
+        take = found & ~resolved
+        result[take] = values[take]
+        resolved |= take
+    return result, resolved
+
+
+def _assign(df, column, values, mask):
+    """Set ``column`` to ``values`` where ``mask`` is True, keeping other rows."""
+    if not mask.any():
+        return
+    if column in df.columns:
+        base = df[column].to_numpy(dtype=object, copy=True)
+    else:
+        base = np.full(len(df), None, dtype=object)
+    base[mask] = values[mask]
+    df[column] = pd.Series(base, index=df.index).infer_objects()
+
+
+def _store_as_codes(df, columns):
+    """Store low-cardinality text columns as categoricals (small integer codes)."""
+    for column in columns:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+
+
+def _drop_missing(record):
+    return {k: v for k, v in record.items() if not (pd.api.types.is_scalar(v) and pd.isna(v))}
+
+
+def _truthy_text(value):
+    # Mirrors the row enrichers: falsy values fall through to the next field,
+    # any other value stops the search even if it strips to empty.
+    return str(value).strip() if value else None
+
+
+def _enrich_brand(df):
+    raw, found = _first_match(df, BRAND_FIELDS, _truthy_text)
+    brands, _ = map_unique(raw, lambda v: normalize_brand(v) if v else None)
+    mask = found & np.fromiter((bool(b) for b in brands), dtype=bool, count=len(brands))
+    _assign(df, 'brand', brands, mask)
+    _assign(df, 'marca', brands, mask)
+
+
+def _enrich_sku(df):
+    raw, found = _first_match(df, SKU_FIELDS, _truthy_text)
+    missing = ~found | np.fromiter((not v for v in raw), dtype=bool, count=len(raw))
+    if missing.any():
+        # Generated SKUs depend on several columns (and a hash of the whole
+        # row as last resort), so they are built per row, only where needed.
+        # Missing cells are dropped so generate_sku() sees them as absent,
+        # as the row path does (NaN would be truthy there).
+        records = df.loc[missing].to_dict('records')
+        raw[missing] = [generate_sku(_drop_missing(record)) for record in records]
+    skus, _ = map_unique(raw, lambda v: normalize_sku(v) if v else None)
+    mask = np.fromiter((bool(s) for s in raw), dtype=bool, count=len(raw))
+    _assign(df, 'sku', skus, mask)
+
+
+def _first_color(value):
+    if not value:
+        return None
+    colors = extract_colors(str(value))
+    return colors[0] if colors else None
+
+
+def _enrich_color(df):
+    primary, found = _first_match(df, COLOR_FIELDS, _first_color)
+    colors, _ = map_unique(primary, normalize_color)
+    spanish, _ = map_unique(colors, get_spanish_color)
+    _assign(df, 'color', colors, found)
+    _assign(df, 'color_es', spanish, found)
+    if found.any():
+        _store_as_codes(df, ['color', 'color_es'])
+
+
+def _weight_tuple(value):
+    if not value:
+        return None
+    info = extract_weight(str(value))
+    return (info['value'], info['unit']) if info else None
+
+
+def _enrich_weight(df):
+    weights, found = _first_match(df, WEIGHT_FIELDS, _weight_tuple)
+    values, _ = map_unique(weights, lambda w: w[0])
+    units, _ = map_unique(weights, lambda w: w[1])
+    spanish_units, _ = map_unique(units, get_spanish_unit)
+    _assign(df, 'weight', values, found)
+    _assign(df, 'weight_unit', units, found)
+    _assign(df, 'peso', values, found)
+    _assign(df, 'unidad_peso', spanish_units, found)
+    if found.any():
+        _store_as_codes(df, ['weight_unit', 'unidad_peso'])
+
+
+def _enrich_ean(df):
+    eans, found = _first_match(df, EAN_FIELDS, lambda v: extract_ean(str(v)) if v else None)
+    valid, _ = map_unique(eans, validate_ean)
+    _assign(df, 'ean', eans, found)
+    _assign(df, 'codigo_barras', eans, found)
+    _assign(df, 'ean_valid', valid, found)
+
+
+def enrich_frame(df):
+    """
+    Apply all enrichments to every row of a DataFrame.
+
+    Args:
+        df (DataFrame): Product data, one product per row
+
+    Returns:
+        DataFrame: Enriched copy of the data
+    """
+    enriched = df.copy()
+    if len(enriched) == 0:
+        return enriched
+
+    # Same order as apply_enrichments(): SKU generation reads the brand.
+    _enrich_brand(enriched)
+    _enrich_sku(enriched)
+    _enrich_color(enriched)
+    _enrich_weight(enriched)
+    _enrich_ean(enriched)
+
+    return enriched
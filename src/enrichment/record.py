@@ -0,0 +1,199 @@
+"""
+Product Record Module
+Compact enrichment result for a single product.
+
+The enhance_* functions each copy the row and store bilingual duplicates
+(brand/marca, weight/peso/unidad_peso, ean/codigo_barras, color/color_es).
+ProductRecord keeps a reference to the source row plus the enriched values
+in __slots__; color and weight unit are small integer codes, and Spanish
+aliases are computed on lookup (get) or when the record is turned into a
+dict. apply_mapping() reads mapped fields straight from the record.
+"""
+
+from .brand import BRAND_FIELDS, normalize_brand
+from .color import COLOR_FIELDS, extract_colors, get_spanish_color, normalize_color
+from .ean import EAN_FIELDS, extract_ean, validate_ean
+from .sku import SKU_FIELDS, generate_sku, normalize_sku
+from .weight import WEIGHT_FIELDS, extract_weight, get_spanish_unit
+
+# Code tables: a record stores the index into these tuples.
+COLORS = ('red', 'blue', 'green', 'yellow', 'orange', 'pink', 'purple', 'black', 'white', 'gray', 'brown')
+WEIGHT_UNITS = ('kg', 'g', 'lb', 'oz', 'ton')
+
+# Output field -> record attribute; Spanish names are aliases.
+_FIELD_ATTRS = {
+    'brand': 'brand', 'marca': 'brand', 'sku': 'sku',
+    'color': 'color', 'color_es': 'color_es',
+    'weight': 'weight', 'peso': 'weight', 'weight_unit': 'weight_unit', 'unidad_peso': 'unidad_peso',
+    'ean': 'ean', 'codigo_barras': 'ean', 'ean_valid': 'ean_valid',
+}
+
+_COLOR_INDEX = {color: code for code, color in enumerate(COLORS)}
+_UNIT_INDEX = {unit: code for code, unit in enumerate(WEIGHT_UNITS)}
+_COLOR_ES = tuple(get_spanish_color(color) for color in COLORS)
+_UNIT_ES = tuple(get_spanish_unit(unit) for unit in WEIGHT_UNITS)
+
+
+def _first_value(data, fields):
+    for field in fields:
+        if field in data and data[field]:
+            return data[field]
+    return None
+
+
+class ProductRecord:
+    """
+    Enriched product without copies of the source row.
+
+    Attributes:
+        source (dict): Original row (shared, never modified)
+        brand (str): Normalized brand or None
+        sku (str): Normalized SKU or None
+        color_code (int): Index into COLORS or None
+        weight (float): Weight value or None
+        unit_code (int): Index into WEIGHT_UNITS or None
+        ean (str): Extracted EAN or None
+        ean_valid (bool): EAN check digit result or None
+    """
+
+    __slots__ = ('source', 'brand', 'sku', 'color_code', 'weight', 'unit_code', 'ean', 'ean_valid')
+
+    def __init__(self, source, brand=None, sku=None, color_code=None, weight=None,
+                 unit_code=None, ean=None, ean_valid=None):
+        self.source = source
+        self.brand = brand
+        self.sku = sku
+        self.color_code = color_code
+        self.weight = weight
+        self.unit_code = unit_code
+        self.ean = ean
+        self.ean_valid = ean_valid
+
+    @property
+    def color(self):
+        return COLORS[self.color_code] if self.color_code is not None else None
+
+    @property
+    def color_es(self):
+        return _COLOR_ES[self.color_code] if self.color_code is not None else None
+
+    @property
+    def weight_unit(self):
+        return WEIGHT_UNITS[self.unit_code] if self.unit_code is not None else None
+
+    @property
+    def unidad_peso(self):
+        return _UNIT_ES[self.unit_code] if self.unit_code is not None else None
+
+    def get(self, field, default=None):
+        """
+        Look up one field as it would appear in to_dict().
+
+        Args:
+            field (str): Field name, enriched (including aliases) or source
+            default: Value returned when the field is absent
+
+        Returns:
+            Enriched value if one was found, else the source value
+        """
+        attr = _FIELD_ATTRS.get(field)
+        if attr is not None:
+            value = getattr(self, attr)
+            if value is not None:
+                return value
+        return self.source.get(field, default)
+
+    def __contains__(self, field):
+        attr = _FIELD_ATTRS.get(field)
+        return (attr is not None and getattr(self, attr) is not None) or field in self.source
+
+    def to_dict(self, aliases=True):
+        """
+        Materialize the record as a row dictionary.
+
+        Args:
+            aliases (bool): Include Spanish alias keys (marca, peso,
+                unidad_peso, codigo_barras, color_es)
+
+        Returns:
+            dict: Same keys and values as apply_enrichments() output
+        """
+        data = self.source.copy()
+        if self.brand:
+            data['brand'] = self.brand
+            if aliases:
+                data['marca'] = self.brand
+        if self.sku is not None:
+            data['sku'] = self.sku
+        if self.color_code is not None:
+            data['color'] = self.color
+            if aliases:
+                data['color_es'] = self.color_es
+        if self.unit_code is not None:
+            data['weight'] = self.weight
+            data['weight_unit'] = self.weight_unit
+            if aliases:
+                data['peso'] = self.weight
+                data['unidad_peso'] = self.unidad_peso
+        if self.ean is not None:
+            data['ean'] = self.ean
+            if aliases:
+                data['codigo_barras'] = self.ean
+            data['ean_valid'] = self.ean_valid
+        return data
+
+
+def enrich_record(data):
+    """
+    Run all enrichments on a row without copying it.
+
+    Args:
+        data (dict): Product data dictionary
+
+    Returns:
+        ProductRecord: Enriched record referencing ``data``
+    """
+    record = ProductRecord(data)
+
+    brand_value = _first_value(data, BRAND_FIELDS)
+    if brand_value is not None:
+        brand_value = str(brand_value).strip()
+        if brand_value:
+            record.brand = normalize_brand(brand_value)
+
+    sku_value = _first_value(data, SKU_FIELDS)
+    sku_value = str(sku_value).strip() if sku_value is not None else None
+    if not sku_value:
+        # generate_sku() sees the row as enhance_sku() would, after the
+        # brand step; only this fallback pays for a copy.
+        view = data
+        if record.brand:
+            view = dict(data, brand=record.brand, marca=record.brand)
+        sku_value = generate_sku(view)
+    if sku_value:
+        record.sku = normalize_sku(sku_value)
+
+    for field in COLOR_FIELDS:
+        if field in data and data[field]:
+            colors = extract_colors(str(data[field]))
+            if colors:
+                record.color_code = _COLOR_INDEX[normalize_color(colors[0])]
+                break
+
+    for field in WEIGHT_FIELDS:
+        if field in data and data[field]:
+            weight_info = extract_weight(str(data[field]))
+            if weight_info:
+                record.weight = weight_info['value']
+                record.unit_code = _UNIT_INDEX[weight_info['unit']]
+                break
+
+    for field in EAN_FIELDS:
+        if field in data and data[field]:
+            ean_value = extract_ean(str(data[field]))
+            if ean_value:
+                record.ean = ean_value
+                record.ean_valid = validate_ean(ean_value)
+                break
+
+    return record
@@ -6,6 +6,12 @@ Provides SKU generation and normalization functionality.
 import re
 import hashlib
 
+# Fields searched for an existing SKU, in priority order
+SKU_FIELDS = ['sku', 'codigo', 'code', 'item_code', 'product_code']
+
+# Fields used for the model part of a generated SKU, in priority order
+MODEL_FIELDS = ['model', 'modelo', 'title', 'titulo', 'name', 'nombre']
+
 def enhance_sku(data):
     """
     Enhance SKU information in product data.
@@ -19,10 +25,9 @@ def enhance_sku(data):
     enhanced_data = data.copy()
     
     # Look for existing SKU
-    sku_fields = ['sku', 'codigo', 'code', 'item_code', 'product_code']
     sku_value = None
     
-    for field in sku_fields:
+    for field in SKU_FIELDS:
         if field in data and data[field]:
             sku_value = str(data[field]).strip()
             break
@@ -55,8 +60,7 @@ def generate_sku(data):
         components.append(brand)
     
     # Add model or title component
-    model_fields = ['model', 'modelo', 'title', 'titulo', 'name', 'nombre']
-    for field in model_fields:
+    for field in MODEL_FIELDS:
         if field in data and data[field]:
             model = str(data[field])
             # Extract alphanumeric chars and take first 8
@@ -5,6 +5,9 @@ Provides weight extraction and normalization functionality.
 
 import re
 
+# Fields searched for a weight, in priority order
+WEIGHT_FIELDS = ['weight', 'peso', 'mass', 'masa', 'title', 'titulo', 'description', 'descripcion', 'specifications', 'especificaciones']
+
 def enhance_weight(data):
     """
     Enhance weight information in product data.
@@ -18,9 +21,7 @@ def enhance_weight(data):
     enhanced_data = data.copy()
     
     # Look for weight in various fields
-    weight_fields = ['weight', 'peso', 'mass', 'masa', 'title', 'titulo', 'description', 'descripcion', 'specifications', 'especificaciones']
-    
-    for field in weight_fields:
+    for field in WEIGHT_FIELDS:
         if field in data and data[field]:
             weight_info = extract_weight(str(data[field]))
             if weight_info:
@@ -1,25 +1,79 @@
 import pandas as pd
-import docx
 import PyPDF2
 
-def read_excel(file_path):
-    return pd.read_excel(file_path)
+from .docx_stream import iter_docx_paragraphs, iter_docx_tables
+from .parse_cache import default_parse_cache
 
-def read_csv(file_path):
+def read_excel(file_path, cache=None):
+    """Read a spreadsheet; parsed frames are reused via the parse cache when enabled."""
+    cache = cache if cache is not None else default_parse_cache()
+    if cache is None:
+        return pd.read_excel(file_path)
+    return cache.frame(file_path, "xlsx", lambda: pd.read_excel(file_path))
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError("The Arrow read path needs pyarrow: pip install pyarrow") from exc
+
+def read_csv(file_path, engine=None):
+    """Read a CSV file; engine="arrow" uses the multithreaded pyarrow parser."""
+    if engine == "arrow":
+        return read_csv_arrow(file_path)
     return pd.read_csv(file_path)
 
+def read_csv_arrow(file_path, use_threads=True):
+    """Parse CSV with pyarrow into a DataFrame backed by Arrow dtypes (no object strings)."""
+    _require_pyarrow()
+    import pyarrow.csv as pa_csv
+    table = pa_csv.read_csv(file_path, read_options=pa_csv.ReadOptions(use_threads=use_threads))
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+def read_parquet(file_path, memory_map=True):
+    """Read a Parquet file written by file_writer, memory-mapped by default."""
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+    table = pq.read_table(file_path, memory_map=memory_map)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+def read_feather(file_path, memory_map=True):
+    """Read a Feather (Arrow IPC) file written by file_writer, memory-mapped by default."""
+    _require_pyarrow()
+    import pyarrow.feather as feather
+    table = feather.read_table(file_path, memory_map=memory_map)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
 def read_txt(file_path):
     with open(file_path, "r") as f:
         return f.read()
 
-def read_docx(file_path):
-    doc = docx.Document(file_path)
-    return "\n".join([para.text for para in doc.paragraphs])
+def _parse_docx_paragraphs(file_path):
+    return list(iter_docx_paragraphs(file_path))
 
-def read_pdf(file_path):
+def read_docx_paragraphs(file_path, cache=None):
+    cache = cache if cache is not None else default_parse_cache()
+    if cache is None:
+        return _parse_docx_paragraphs(file_path)
+    return cache.pages(file_path, "docx", lambda: _parse_docx_paragraphs(file_path))
+
+def read_docx(file_path, cache=None):
+    return "\n".join(read_docx_paragraphs(file_path, cache))
+
+def read_docx_tables(file_path, chunk_size=5000):
+    """Stream the tables of a DOCX file as DataFrame chunks for apply_mapping."""
+    return iter_docx_tables(file_path, chunk_size)
+
+def _parse_pdf_pages(file_path):
     with open(file_path, "rb") as f:
         reader = PyPDF2.PdfReader(f)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() or ""
-        return text
\ No newline at end of file
+        return [page.extract_text() or "" for page in reader.pages]
+
+def read_pdf_pages(file_path, cache=None):
+    cache = cache if cache is not None else default_parse_cache()
+    if cache is None:
+        return _parse_pdf_pages(file_path)
+    return cache.pages(file_path, "pdf", lambda: _parse_pdf_pages(file_path))
+
+def read_pdf(file_path, cache=None):
+    return "".join(read_pdf_pages(file_path, cache))
@@ -0,0 +1,101 @@
+import os
+
+import pandas as pd
+
+def write_csv(df, file_path):
+    df.to_csv(file_path, index=False)
+
+def write_excel(df, file_path):
+    df.to_excel(file_path, index=False)
+
+def _text_schema(columns):
+    """Arrow schema storing every column as text, like the CSV output."""
+    import pyarrow as pa
+    return pa.schema([(c, pa.string()) for c in columns])
+
+def _text_table(df, schema):
+    """Arrow table of ``df`` under a text ``schema``; missing cells and columns become ""."""
+    import pyarrow as pa
+    df = df.set_axis([str(c) for c in df.columns], axis=1)
+    df = df.reindex(columns=schema.names, fill_value="")
+    text = pd.DataFrame({c: df[c].astype("string").fillna("") for c in schema.names})
+    return pa.Table.from_pandas(text, schema=schema, preserve_index=False)
+
+def write_parquet(df, file_path):
+    """Write a columnar Parquet file of text columns; re-runs can memory-map it with file_reader.read_parquet."""
+    import pyarrow.parquet as pq
+    pq.write_table(_text_table(df, _text_schema([str(c) for c in df.columns])), file_path)
+
+def write_feather(df, file_path):
+    """Write an uncompressed Arrow IPC file of text columns, the fastest format to memory-map back."""
+    import pyarrow.feather as feather
+    table = _text_table(df, _text_schema([str(c) for c in df.columns]))
+    feather.write_feather(table, file_path, compression="uncompressed")
+
+WRITERS = {
+    ".csv": write_csv,
+    ".xlsx": write_excel,
+    ".parquet": write_parquet,
+    ".feather": write_feather,
+    ".arrow": write_feather,
+}
+
+def write_output(df, file_path):
+    """Write a mapped catalog, picking the format from the file extension."""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in WRITERS:
+        raise ValueError(f"Unsupported output format: {ext}")
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError("Output must be a DataFrame")
+    WRITERS[ext](df, file_path)
+
+class ChunkWriter:
+    """
+    Append DataFrame chunks to one output file (CSV, Parquet or Feather).
+
+    Columnar outputs use a schema pinned up front: the given columns (or
+    the first chunk's), all stored as text as in write_parquet and
+    write_feather. Every chunk is written with that schema, so chunks
+    whose columns infer different types (numbers in one, "" in the next)
+    give one consistent file. Missing cells are written as "".
+    """
+
+    def __init__(self, file_path, columns=None):
+        self.file_path = file_path
+        self.ext = os.path.splitext(file_path)[1].lower()
+        if self.ext not in (".csv", ".parquet", ".feather", ".arrow"):
+            raise ValueError(f"Unsupported chunked output format: {self.ext}")
+        self.columns = list(columns) if columns is not None else None
+        self.rows = 0
+        self._writer = None
+        self._schema = None
+
+    def write(self, df):
+        if self.ext == ".csv":
+            df.to_csv(self.file_path, mode="a" if self.rows else "w", header=not self.rows, index=False)
+        else:
+            if self._schema is None:
+                if self.columns is None:
+                    self.columns = [str(c) for c in df.columns]
+                self._schema = _text_schema([str(c) for c in self.columns])
+            table = _text_table(df, self._schema)
+            if self._writer is None:
+                import pyarrow.ipc as ipc
+                import pyarrow.parquet as pq
+                if self.ext == ".parquet":
+                    self._writer = pq.ParquetWriter(self.file_path, self._schema)
+                else:
+                    self._writer = ipc.new_file(self.file_path, self._schema)
+            self._writer.write_table(table)
+        self.rows += len(df)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,7 +1,9 @@
 import pandas as pd
-from .enrichment import apply_enrichments
+from .ai.client import run_sync
+from .ai.enrich import default_ai_client, enrich_frame_ai, enrich_records, is_ai_enabled
+from .enrichment import enrich_frame, enrich_record
 
-def apply_mapping(data, mapping, template_columns):
+def apply_mapping(data, mapping, template_columns, ai_client=None):
     """
     Apply mapping and enrichment to product data.
     
@@ -9,29 +11,70 @@ def apply_mapping(data, mapping, template_columns):
         data: DataFrame or dict containing product data
         mapping: dict of source_column -> template_column mappings
         template_columns: list of Mercado Libre template columns
+        ai_client: EnrichmentClient for the optional AI stage (ENABLE_AI=1);
+            None uses the backend configured in the environment
         
     Returns:
-        DataFrame: Mapped and enriched product data
+        DataFrame: Mapped and enriched product data, one row per input row
     """
-    # Convert DataFrame row to dict if needed
+    # DataFrames are enriched column-wise over unique values and mapped
+    # row for row
     if isinstance(data, pd.DataFrame):
-        if len(data) > 0:
-            row_data = data.iloc[0].to_dict()
-        else:
-            row_data = {}
-    else:
-        row_data = data.copy() if isinstance(data, dict) else {}
+        return _apply_mapping_frame(data, mapping, template_columns, ai_client)
+
+    row_data = data.copy() if isinstance(data, dict) else {}
     
-    # Apply enrichments first to enhance available data
-    enriched_data = apply_enrichments(row_data)
+    # Apply enrichments first to enhance available data; the compact
+    # record is read directly instead of building an enriched dict
+    enriched_data = enrich_record(row_data)
+    if is_ai_enabled():
+        client = ai_client or default_ai_client()
+        if client is not None:
+            enriched_data = run_sync(enrich_records([enriched_data.to_dict()], client))[0]
     
     # Apply column mapping
     mapped = {}
     for src_col, tpl_col in mapping.items():
         if src_col in enriched_data:
-            mapped[tpl_col] = enriched_data[src_col]
+            mapped[tpl_col] = enriched_data.get(src_col)
     
     # Ensure all template columns are present
     result = {col: mapped.get(col, "") for col in template_columns}
     
-    return pd.DataFrame([result])
\ No newline at end of file
+    return pd.DataFrame([result])
+
+
+def _fill_missing(series):
+    if not series.isna().any():
+        return series
+    return series.astype(object).where(series.notna(), "")
+
+
+def _apply_mapping_frame(df, mapping, template_columns, ai_client=None):
+    enriched = enrich_frame_ai(enrich_frame(df), ai_client)
+    return map_enriched_frame(enriched, mapping, template_columns)
+
+
+def map_enriched_frame(enriched, mapping, template_columns):
+    """
+    Map an already enriched DataFrame onto the template columns.
+
+    Args:
+        enriched: DataFrame returned by enrich_frame()
+        mapping: dict of source_column -> template_column mappings
+        template_columns: list of Mercado Libre template columns
+
+    Returns:
+        DataFrame: Mapped product data with the input index; cells that
+        could not be filled are "" as in the row path
+    """
+    mapped = {}
+    for src_col, tpl_col in mapping.items():
+        if src_col in enriched.columns:
+            mapped[tpl_col] = _fill_missing(enriched[src_col])
+
+    result = pd.DataFrame(index=enriched.index)
+    for col in template_columns:
+        result[col] = mapped[col] if col in mapped else ""
+
+    return result
@@ -0,0 +1,230 @@
+"""
+Parsed-input cache keyed by the content hash of uploaded files.
+
+Parsing XLSX, DOCX and PDF is the slowest step of a run, and users often
+re-upload the same file after changing only the mapping. Parsed results are
+stored on disk under the SHA-256 of the file bytes: spreadsheets as a
+Parquet snapshot, text documents as a JSON list of pages/paragraphs. Only
+data formats are used, never pickle, so a writable cache directory cannot
+be used to run code. Column labels and object columns mixing types (an
+Excel column holding 123 and "A-55") are stored as JSON text next to the
+Parquet data and restored on read, so a cached frame equals a freshly
+parsed one; frames that cannot be stored this way are simply not cached.
+The directory is kept under a size budget by evicting the least recently
+used entries. The cache never fails a read: unreadable entries are misses
+and results that cannot be stored are returned uncached (counted in
+``store_failures`` and logged).
+
+Enable for the file readers with:
+    ML_EXTRACTOR_PARSE_CACHE=/path/to/cache
+    ML_EXTRACTOR_PARSE_CACHE_MB=512   (optional, default 512)
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+import pandas as pd
+
+# Bump when the stored format or a parser's output changes.
+CACHE_VERSION = "4"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+FRAME_METADATA_KEY = b"ml_extractor"
+
+logger = logging.getLogger(__name__)
+
+
+def file_digest(file_path, block_size=1024 * 1024):
+    """Hex SHA-256 of a file's bytes, read in blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _encode_frame(df):
+    """Arrow table of a frame, with labels and mixed object columns JSON-encoded."""
+    import pyarrow as pa
+
+    # Columns are stored by position; the real labels (numbers, duplicates)
+    # go into the metadata.
+    data = df.set_axis([str(i) for i in range(df.shape[1])], axis=1)
+    encoded = []
+    for name in data.columns:
+        column = data[name]
+        if column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) not in ("string", "empty"):
+            data[name] = [json.dumps(value) for value in column]
+            encoded.append(name)
+
+    table = pa.Table.from_pandas(data, preserve_index=True)
+    metadata = dict(table.schema.metadata or {})
+    metadata[FRAME_METADATA_KEY] = json.dumps({"labels": df.columns.tolist(), "encoded": encoded})
+    return table.replace_schema_metadata(metadata)
+
+
+def _decode_frame(table):
+    """Inverse of _encode_frame."""
+    info = json.loads(table.schema.metadata[FRAME_METADATA_KEY])
+    df = table.to_pandas()
+    for name in info["encoded"]:
+        df[name] = pd.Series([json.loads(value) for value in df[name]], index=df.index, dtype=object)
+    df.columns = pd.Index(info["labels"])
+    return df
+
+
+class ParseCache:
+    """
+    Size-bounded disk cache of parsed files.
+
+    Args:
+        directory (str): Cache directory, created on first write
+        max_bytes (int): Total size budget for cached entries
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.store_failures = 0
+
+    def key(self, file_path, kind):
+        return f"{kind}-v{CACHE_VERSION}-{file_digest(file_path)}"
+
+    def _lookup(self, key, suffixes):
+        for suffix in suffixes:
+            path = os.path.join(self.directory, key + suffix)
+            try:
+                # Refresh mtime so eviction sees this entry as recently used.
+                # Another process may evict it at any time: treat as a miss.
+                os.utime(path)
+            except OSError:
+                continue
+            return path
+        return None
+
+    def _store(self, key, suffix, write):
+        """Write an entry; failures (disk, missing pyarrow, unstorable data) are counted and logged."""
+        path = os.path.join(self.directory, key + suffix)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as exc:
+            self.store_failures += 1
+            logger.warning("parse cache: not storing %s: %s", key, exc)
+            return
+        finally:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        self.evict()
+
+    def frame(self, file_path, kind, parse):
+        """
+        Return the cached DataFrame for a file, parsing it on a miss.
+
+        Args:
+            file_path (str): File to read
+            kind (str): Parser identifier, e.g. 'xlsx'
+            parse (callable): Zero-argument function returning the DataFrame
+
+        Returns:
+            DataFrame: Parsed data, the same whether it came from the cache
+        """
+        key = self.key(file_path, kind)
+        path = self._lookup(key, (".parquet",))
+        if path is not None:
+            try:
+                import pyarrow.parquet as pq
+                df = _decode_frame(pq.read_table(path))
+            except Exception:
+                df = None
+            if df is not None:
+                self.hits += 1
+                return df
+
+        self.misses += 1
+        df = parse()
+
+        def write(p):
+            import pyarrow.parquet as pq
+            pq.write_table(_encode_frame(df), p)
+
+        self._store(key, ".parquet", write)
+        return df
+
+    def pages(self, file_path, kind, parse):
+        """
+        Return the cached list of page/paragraph texts for a file, parsing on a miss.
+
+        Args:
+            file_path (str): File to read
+            kind (str): Parser identifier, e.g. 'pdf' or 'docx'
+            parse (callable): Zero-argument function returning a list of strings
+
+        Returns:
+            list: Page or paragraph texts
+        """
+        key = self.key(file_path, kind)
+        path = self._lookup(key, (".json",))
+        if path is not None:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    pages = json.load(f)
+            except (OSError, ValueError):
+                pages = None
+            if pages is not None:
+                self.hits += 1
+                return pages
+
+        self.misses += 1
+        pages = list(parse())
+
+        def write(p):
+            with open(p, "w", encoding="utf-8") as f:
+                json.dump(pages, f, ensure_ascii=False)
+
+        self._store(key, ".json", write)
+        return pages
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits its budget."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        entries = []
+        for name in names:
+            if name.endswith(".tmp"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+def default_parse_cache():
+    """ParseCache configured from ML_EXTRACTOR_PARSE_CACHE, or None when unset."""
+    directory = os.environ.get("ML_EXTRACTOR_PARSE_CACHE")
+    if not directory:
+        return None
+    max_mb = os.environ.get("ML_EXTRACTOR_PARSE_CACHE_MB")
+    max_bytes = int(max_mb) * 1024 * 1024 if max_mb else DEFAULT_MAX_BYTES
+    return ParseCache(directory, max_bytes)
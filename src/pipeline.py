@@ -0,0 +1,271 @@
+"""
+Chunked mapping pipeline with a memory budget.
+
+A reader thread pulls chunks from the input, worker threads enrich and map
+them, and the calling thread writes them in order. The number of chunks in
+flight is bounded (bounded queues plus a slot semaphore), so a slow stage
+blocks the ones before it instead of letting chunks pile up in memory.
+
+Chunk size is not fixed: MemoryGovernor measures the real per-row footprint
+of finished chunks (raw + enriched + mapped frames) and sizes the next
+chunks so that all chunks in flight fit in the memory budget.
+"""
+
+import os
+import queue
+import resource
+import threading
+
+import pandas as pd
+
+from .ai.enrich import default_ai_client, enrich_frame_ai, is_ai_enabled
+from .enrichment import enrich_frame
+from .file_writer import ChunkWriter
+from .mapper import map_enriched_frame
+
+
+def current_rss():
+    """
+    Resident set size of this process in bytes.
+
+    Reads /proc/self/statm where available; elsewhere falls back to the
+    peak RSS reported by getrusage (an upper bound).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, KiB elsewhere
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class MemoryGovernor:
+    """
+    Sizes chunks so that all chunks in flight fit in a memory budget.
+
+    Args:
+        budget_bytes (int): Memory the whole process may use
+        in_flight (int): Maximum chunks alive at once
+        initial_rows (int): Chunk size until a footprint has been measured
+        min_rows (int): Smallest chunk size
+        max_rows (int): Largest chunk size
+        headroom (float): Fraction of the budget to plan for; the rest
+            absorbs allocator slack and parser temporaries
+        rss_func (callable): Returns current RSS in bytes
+    """
+
+    def __init__(self, budget_bytes, in_flight=4, initial_rows=1000, min_rows=100,
+                 max_rows=200000, headroom=0.7, rss_func=current_rss):
+        self.budget_bytes = budget_bytes
+        self.in_flight = max(1, in_flight)
+        self.initial_rows = initial_rows
+        self.min_rows = min_rows
+        self.max_rows = max_rows
+        self.headroom = headroom
+        self.rss_func = rss_func
+        self.baseline = rss_func()
+        self.row_bytes = None
+        self.peak_rss = self.baseline
+        self._lock = threading.Lock()
+
+    def observe(self, rows, nbytes):
+        """
+        Record the memory one finished chunk needed.
+
+        The largest per-row footprint seen so far is kept, so a wide or
+        text-heavy stretch of the file shrinks later chunks and never
+        grows them back past a safe size.
+        """
+        if rows <= 0:
+            return
+        with self._lock:
+            per_row = nbytes / rows
+            if self.row_bytes is None or per_row > self.row_bytes:
+                self.row_bytes = per_row
+            self.peak_rss = max(self.peak_rss, self.rss_func())
+
+    def chunk_rows(self):
+        """Number of rows the reader should take next."""
+        with self._lock:
+            if self.row_bytes is None:
+                return self.initial_rows
+            available = self.budget_bytes * self.headroom - self.baseline
+            rows = int(available / (self.row_bytes * self.in_flight))
+            if self.rss_func() > self.budget_bytes * self.headroom:
+                # Over the planned level already: back off hard.
+                rows //= 2
+            return max(self.min_rows, min(self.max_rows, rows))
+
+
+def csv_chunks(file_path):
+    """
+    Chunk source for a CSV file: call with a row count, returns a DataFrame or None at the end.
+
+    Cells are read as text ("" when empty) so a value is written the same
+    way whichever chunk it lands in; per-chunk type inference would turn
+    10 into "10.0" in a chunk that also has an empty cell.
+    """
+    reader = pd.read_csv(file_path, chunksize=1, dtype=str, keep_default_na=False)
+
+    def next_chunk(n_rows):
+        try:
+            return reader.get_chunk(n_rows)
+        except StopIteration:
+            reader.close()
+            return None
+
+    return next_chunk
+
+
+def frame_chunks(df):
+    """Chunk source slicing an in-memory DataFrame."""
+    position = [0]
+
+    def next_chunk(n_rows):
+        start = position[0]
+        if start >= len(df):
+            return None
+        position[0] = start + n_rows
+        return df.iloc[start:start + n_rows]
+
+    return next_chunk
+
+
+_DONE = object()
+
+
+def run_pipeline(source, mapping, template_columns, output_path, memory_budget,
+                 workers=2, queue_size=2, initial_rows=1000, governor=None, ai_client=None):
+    """
+    Enrich and map a catalog chunk by chunk within a memory budget.
+
+    Args:
+        source: CSV path, DataFrame, or a chunk source function
+            ``next_chunk(n_rows) -> DataFrame | None``
+        mapping: dict of source_column -> template_column mappings
+        template_columns: list of Mercado Libre template columns
+        output_path (str): .csv, .parquet or .feather output file
+        memory_budget (int): Process memory budget in bytes
+        workers (int): Enrichment worker threads
+        queue_size (int): Capacity of each queue between stages
+        initial_rows (int): Rows in the first chunks, before measurements
+        governor: Optional MemoryGovernor to use instead of a new one
+        ai_client: EnrichmentClient for the optional AI stage (ENABLE_AI=1);
+            None uses the backend configured in the environment
+
+    Returns:
+        dict: rows, chunks, chunk_sizes, row_bytes and peak_rss
+    """
+    if isinstance(source, str):
+        next_chunk = csv_chunks(source)
+    elif isinstance(source, pd.DataFrame):
+        next_chunk = frame_chunks(source)
+    else:
+        next_chunk = source
+
+    if ai_client is None and is_ai_enabled():
+        # One client for all chunks so its cache and stats are shared.
+        ai_client = default_ai_client()
+
+    # Queued chunks on both sides, one per worker, plus reader and writer.
+    in_flight = 2 * queue_size + workers + 2
+    if governor is None:
+        governor = MemoryGovernor(memory_budget, in_flight=in_flight, initial_rows=initial_rows)
+
+    slots = threading.BoundedSemaphore(in_flight)
+    in_queue = queue.Queue(maxsize=queue_size)
+    out_queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    chunk_sizes = []
+
+    def put(q, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read():
+        index = 0
+        try:
+            while not stop.is_set():
+                if not slots.acquire(timeout=0.1):
+                    continue
+                chunk = next_chunk(governor.chunk_rows())
+                if chunk is None or len(chunk) == 0:
+                    slots.release()
+                    break
+                chunk_sizes.append(len(chunk))
+                if not put(in_queue, (index, chunk)):
+                    return
+                index += 1
+        except Exception as exc:
+            put(out_queue, (-1, exc))
+        finally:
+            for _ in range(workers):
+                put(in_queue, _DONE)
+
+    def work():
+        while not stop.is_set():
+            try:
+                item = in_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                put(out_queue, _DONE)
+                return
+            index, chunk = item
+            try:
+                enriched = enrich_frame_ai(enrich_frame(chunk), ai_client)
+                mapped = map_enriched_frame(enriched, mapping, template_columns)
+                nbytes = (chunk.memory_usage(deep=True).sum()
+                          + enriched.memory_usage(deep=True).sum()
+                          + mapped.memory_usage(deep=True).sum())
+                del enriched
+                governor.observe(len(chunk), nbytes)
+            except Exception as exc:
+                mapped = exc
+            if not put(out_queue, (index, mapped)):
+                return
+
+    threads = [threading.Thread(target=read, daemon=True)]
+    threads += [threading.Thread(target=work, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    pending = {}
+    next_index = 0
+    finished_workers = 0
+    try:
+        with ChunkWriter(output_path, columns=template_columns) as writer:
+            while finished_workers < workers:
+                item = out_queue.get()
+                if item is _DONE:
+                    finished_workers += 1
+                    continue
+                index, mapped = item
+                if isinstance(mapped, Exception):
+                    raise mapped
+                pending[index] = mapped
+                # Write in input order; out-of-order chunks wait here and
+                # still hold their slot, which keeps the reader bounded.
+                while next_index in pending:
+                    writer.write(pending.pop(next_index))
+                    next_index += 1
+                    slots.release()
+            rows = writer.rows
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    return {
+        "rows": rows,
+        "chunks": len(chunk_sizes),
+        "chunk_sizes": chunk_sizes,
+        "row_bytes": governor.row_bytes,
+        "peak_rss": max(governor.peak_rss, current_rss()),
+    }
@@ -0,0 +1,94 @@
+import asyncio
+
+import pandas as pd
+
+from src.ai import EnrichmentClient, HTTPBackend, ResponseCache, StubBackend, enrich_records
+from src.ai.backends import stub_completion
+from src.ai.stub_server import start_stub_server
+from src.mapper import apply_mapping
+
+def test_duplicates_sent_once_and_batched():
+    backend = StubBackend()
+    client = EnrichmentClient(backend, batch_size=2)
+    out = client.complete_sync(["a", "b", "a", "c", "b"])
+    assert out == [stub_completion(p) for p in ["a", "b", "a", "c", "b"]]
+    assert client.stats["unique"] == 3
+    assert backend.requests == 2
+
+def test_cache_hits_skip_backend(tmp_path):
+    backend = StubBackend()
+    EnrichmentClient(backend, cache=ResponseCache(str(tmp_path))).complete_sync(["x", "y"])
+    cache = ResponseCache(str(tmp_path))
+    client = EnrichmentClient(backend, cache=cache)
+    client.complete_sync(["x", "y"])
+    assert backend.requests == 1
+    assert cache.hit_rate == 1.0
+
+def test_retry_after_failure():
+    backend = StubBackend(fail_every=1)
+    client = EnrichmentClient(backend, max_retries=1, backoff=0)
+    assert client.complete_sync(["x"]) == [None]
+    assert client.stats["retries"] == 1
+    assert client.stats["failed"] == 1
+
+def test_enrich_disabled_returns_records_unchanged():
+    rec = {"title": "Sony Headphones"}
+    out = asyncio.run(enrich_records([rec], EnrichmentClient(StubBackend()), enable_ai=False))
+    assert out == [rec]
+
+def test_enrich_fills_missing_description():
+    recs = [{"title": "Sony Headphones", "sku": "A1"}, {"title": "Sony Headphones", "sku": "A2"}]
+    client = EnrichmentClient(StubBackend())
+    out = asyncio.run(enrich_records(recs, client, enable_ai=True))
+    assert out[0]["description"] == out[1]["description"]
+    assert out[0]["_meta"]["ai"]["fields_modified"] == ["description"]
+    assert client.stats["unique"] == 1
+
+def test_enrich_failure_marks_meta():
+    client = EnrichmentClient(StubBackend(fail_every=1), max_retries=0)
+    out = asyncio.run(enrich_records([{"title": "X"}], client, enable_ai=True))
+    assert "description" not in out[0]
+    assert out[0]["_meta"]["ai"]["method"] == "ai_failed"
+
+def test_http_stub_server_roundtrip():
+    server, url = start_stub_server()
+    try:
+        out = EnrichmentClient(HTTPBackend(url)).complete_sync(["x", "y"])
+    finally:
+        server.shutdown()
+    assert out == [stub_completion("x"), stub_completion("y")]
+
+def test_cache_keyed_by_backend_name(tmp_path):
+    class OtherBackend(StubBackend):
+        name = "other-v1"
+        async def complete(self, prompts):
+            self.requests += 1
+            return ["other" for _ in prompts]
+    EnrichmentClient(StubBackend(), cache=ResponseCache(str(tmp_path))).complete_sync(["x"])
+    other = OtherBackend()
+    out = EnrichmentClient(other, cache=ResponseCache(str(tmp_path))).complete_sync(["x"])
+    assert out == ["other"]
+    assert other.requests == 1
+
+def test_complete_sync_inside_running_loop():
+    client = EnrichmentClient(StubBackend())
+
+    async def caller():
+        return client.complete_sync(["x"])
+
+    assert asyncio.run(caller()) == [stub_completion("x")]
+
+def test_apply_mapping_runs_ai_stage_when_enabled(monkeypatch):
+    data = pd.DataFrame({"title": ["Sony Headphones", "Sony Headphones"], "sku": ["A1", "A2"]})
+    mapping = {"title": "Titulo", "description": "Descripcion"}
+    client = EnrichmentClient(StubBackend())
+
+    monkeypatch.delenv("ENABLE_AI", raising=False)
+    assert apply_mapping(data, mapping, ["Titulo", "Descripcion"], ai_client=client)["Descripcion"].tolist() == ["", ""]
+
+    monkeypatch.setenv("ENABLE_AI", "1")
+    out = apply_mapping(data, mapping, ["Titulo", "Descripcion"], ai_client=client)
+    row = apply_mapping(data.iloc[0].to_dict(), mapping, ["Titulo", "Descripcion"], ai_client=client)
+    assert out["Descripcion"].iloc[0].startswith("Descripción generada")
+    assert out["Descripcion"].tolist() == [row["Descripcion"].iloc[0]] * 2
+    assert client.stats["unique"] == 2
@@ -0,0 +1,85 @@
+import docx
+
+from src.docx_stream import iter_docx, iter_docx_paragraphs, iter_docx_tables
+from src.mapper import apply_mapping
+
+def make_docx(path, n_rows=3):
+    doc = docx.Document()
+    doc.add_paragraph("Lista de precios")
+    table = doc.add_table(rows=n_rows + 1, cols=3)
+    for j, name in enumerate(["nombre", "Precio", "marca"]):
+        table.cell(0, j).text = name
+    for i in range(1, n_rows + 1):
+        table.cell(i, 0).text = f"Auriculares negro {i}"
+        table.cell(i, 1).text = str(100 + i)
+        table.cell(i, 2).text = "sony"
+    doc.add_paragraph("Precios con IVA")
+    doc.save(str(path))
+    return path
+
+def test_paragraphs_match_python_docx(tmp_path):
+    path = make_docx(tmp_path / "lista.docx")
+    expected = [p.text for p in docx.Document(str(path)).paragraphs]
+    assert list(iter_docx_paragraphs(str(path))) == expected
+
+def test_rows_streamed_in_order(tmp_path):
+    path = make_docx(tmp_path / "lista.docx", n_rows=2)
+    kinds = [item[0] for item in iter_docx(str(path))]
+    assert kinds == ["paragraph", "row", "row", "row", "paragraph"]
+
+def test_tables_chunked_with_header(tmp_path):
+    path = make_docx(tmp_path / "lista.docx", n_rows=5)
+    chunks = list(iter_docx_tables(str(path), chunk_size=2))
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert list(chunks[0].columns) == ["nombre", "Precio", "marca"]
+    assert chunks[2].loc[0, "nombre"] == "Auriculares negro 5"
+
+def test_table_chunk_feeds_mapper(tmp_path):
+    path = make_docx(tmp_path / "lista.docx")
+    chunk = next(iter_docx_tables(str(path)))
+    out = apply_mapping(chunk, {"nombre": "title", "brand": "brand", "color": "color"}, ["title", "brand", "color"])
+    assert len(out) == 3
+    assert out.loc[0, "brand"] == "Sony"
+    assert out.loc[0, "color"] == "black"
+
+TEXTBOX_RUN = (
+    '<w:r><mc:AlternateContent xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">'
+    '<mc:Choice Requires="wps"><w:drawing><w:txbxContent><w:p><w:r><w:t>Caja</w:t></w:r></w:p>'
+    '</w:txbxContent></w:drawing></mc:Choice>'
+    '<mc:Fallback><w:pict><w:txbxContent><w:p><w:r><w:t>Caja</w:t></w:r></w:p>'
+    '</w:txbxContent></w:pict></mc:Fallback></mc:AlternateContent></w:r>'
+)
+
+def test_textbox_paragraphs_skipped(tmp_path):
+    import zipfile
+    doc = docx.Document()
+    doc.add_paragraph("Intro")
+    doc.add_paragraph("ANCLA")
+    doc.add_paragraph("Fin")
+    plain = tmp_path / "plain.docx"
+    doc.save(str(plain))
+    path = tmp_path / "textbox.docx"
+    with zipfile.ZipFile(plain) as src, zipfile.ZipFile(path, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "word/document.xml":
+                data = data.decode("utf-8").replace("<w:r><w:t>ANCLA</w:t></w:r>", TEXTBOX_RUN).encode("utf-8")
+            dst.writestr(item, data)
+    expected = [p.text for p in docx.Document(str(path)).paragraphs]
+    assert list(iter_docx_paragraphs(str(path))) == expected
+    assert "Caja" not in expected
+
+def test_page_and_column_breaks_add_no_text(tmp_path):
+    from docx.enum.text import WD_BREAK
+    doc = docx.Document()
+    run = doc.add_paragraph().add_run("Mesa")
+    run.add_break()
+    run.add_text("roja")
+    run.add_break(WD_BREAK.PAGE)
+    run.add_text("Silla")
+    run.add_break(WD_BREAK.COLUMN)
+    run.add_text("azul")
+    path = tmp_path / "saltos.docx"
+    doc.save(str(path))
+    expected = [p.text for p in docx.Document(str(path)).paragraphs]
+    assert list(iter_docx_paragraphs(str(path))) == expected == ["Mesa\nrojaSillaazul"]
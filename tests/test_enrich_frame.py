@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+
+from src.enrichment import apply_enrichments, enrich_frame
+from src.enrichment import frame
+from src.mapper import apply_mapping
+
+ENRICHED_KEYS = ["brand", "marca", "sku", "color", "color_es", "weight", "weight_unit",
+                 "peso", "unidad_peso", "ean", "codigo_barras", "ean_valid"]
+
+ROWS = [
+    {"titulo": "Auriculares Sony negro 250 g", "marca": "SONY", "codigo": "ab 12", "barcode": "7790000000015"},
+    {"titulo": "Auriculares Sony negro 250 g", "marca": "SONY", "codigo": "ab 13", "barcode": "7790000000015"},
+    {"titulo": "Licuadora 1.5kg", "marca": "", "codigo": "", "barcode": "sin codigo"},
+    {"titulo": "Pelota", "marca": "nike", "codigo": "P-1", "barcode": "12345678"},
+]
+
+def test_frame_matches_row_enrichment():
+    out = enrich_frame(pd.DataFrame(ROWS))
+    for i, row in enumerate(ROWS):
+        expected = apply_enrichments(row)
+        for key in ENRICHED_KEYS:
+            if key in expected:
+                assert out.loc[i, key] == expected[key], key
+
+def test_extraction_runs_once_per_unique_value(monkeypatch):
+    calls = []
+    def counting_extract(text):
+        calls.append(text)
+        return None
+    monkeypatch.setattr(frame, "extract_weight", counting_extract)
+    df = pd.DataFrame({"titulo": ["Mesa 2kg", "Silla"] * 500})
+    enrich_frame(df)
+    assert sorted(calls) == ["Mesa 2kg", "Silla"]
+
+def test_missing_values_not_enriched():
+    df = pd.DataFrame({"titulo": [None, "Zapatos rojo"]})
+    out = enrich_frame(df)
+    assert pd.isna(out.loc[0, "color"])
+    assert out.loc[1, "color"] == "red"
+
+def test_apply_mapping_maps_every_row():
+    df = pd.DataFrame(ROWS)
+    out = apply_mapping(df, {"titulo": "title", "brand": "marca_ml"}, ["title", "marca_ml", "price"])
+    assert list(out.columns) == ["title", "marca_ml", "price"]
+    assert len(out) == len(ROWS)
+    assert out.loc[3, "marca_ml"] == "Nike"
+    assert (out["price"] == "").all()
+
+def test_color_and_unit_stored_as_codes():
+    out = enrich_frame(pd.DataFrame(ROWS))
+    assert isinstance(out["color"].dtype, pd.CategoricalDtype)
+    assert isinstance(out["weight_unit"].dtype, pd.CategoricalDtype)
+
+def test_generated_sku_ignores_missing_brand():
+    rows = [{"marca": "sony", "nombre": "Radio"}, {"marca": "", "nombre": "Mesa"}, {"marca": "", "nombre": ""}]
+    out = enrich_frame(pd.DataFrame(rows))
+    assert out["sku"].tolist() == [apply_enrichments(r)["sku"] for r in rows]
+    assert out.loc[1, "sku"] == "MESA"
+
+def test_generated_sku_ignores_arrow_nulls():
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"marca": ["sony", None], "nombre": ["Radio", "Mesa"]}).astype("string[pyarrow]")
+    assert enrich_frame(df)["sku"].tolist() == ["SON-RADIO", "MESA"]
+
+def test_frame_and_row_mapping_agree_on_missing_values():
+    rows = [{"titulo": "Mesa 2kg negro"}, {"titulo": "Silla"}]
+    mapping = {"titulo": "Titulo", "weight": "Peso", "color": "Color", "ean": "EAN"}
+    template = ["Titulo", "Peso", "Color", "EAN", "Precio"]
+    frame_out = apply_mapping(pd.DataFrame(rows), mapping, template)
+    for i, row in enumerate(rows):
+        row_out = apply_mapping(row, mapping, template).iloc[0].to_dict()
+        assert frame_out.loc[i].to_dict() == row_out
+    assert frame_out.loc[1, "Peso"] == ""
+
+def test_supplier_color_column_untouched_without_enrichment():
+    out = enrich_frame(pd.DataFrame({"color": ["Turquesa", "Coral"]}))
+    assert not isinstance(out["color"].dtype, pd.CategoricalDtype)
+
+def test_equal_values_of_different_types_kept_apart():
+    df = pd.DataFrame({"sku": pd.Series([1, 1.0, True, "1"], dtype=object)})
+    expected = [apply_enrichments(r)["sku"] for r in df.to_dict("records")]
+    assert expected == ["1", "10", "TRUE", "1"]
+    assert enrich_frame(df)["sku"].tolist() == expected
@@ -0,0 +1,41 @@
+from src.enrichment import enhance_brand, enhance_color, enhance_ean, enhance_sku, enhance_weight
+from src.enrichment.record import ProductRecord, enrich_record
+
+def chained(rec):
+    return enhance_ean(enhance_weight(enhance_color(enhance_sku(enhance_brand(rec)))))
+
+def test_record_matches_chained_enrichers():
+    recs = [
+        {"title": "Zapatos rojo 1.5kg", "brand": "nike", "barcode": "7891234567895"},
+        {"titulo": "Pelota", "codigo": "p 1"},
+        {"description": "sin datos"},
+        {"title": "Sony Headphones", "sku": "   "},
+    ]
+    for rec in recs:
+        assert enrich_record(rec).to_dict() == chained(rec)
+
+def test_record_stores_codes_and_shares_source():
+    rec = {"title": "Producto negro 2 libra"}
+    out = enrich_record(rec)
+    assert out.source is rec
+    assert isinstance(out.color_code, int) and out.color == "black"
+    assert out.weight_unit == "lb" and out.unidad_peso == "libra"
+    assert not hasattr(out, "__dict__")
+
+def test_to_dict_without_aliases():
+    out = enrich_record({"brand": "sony", "ean": "7891234567895"}).to_dict(aliases=False)
+    assert out["brand"] == "Sony" and "marca" not in out
+    assert out["ean"] == "7891234567895" and "codigo_barras" not in out
+
+def test_empty_record():
+    out = enrich_record({"title": ""})
+    assert isinstance(out, ProductRecord)
+    assert out.brand is None and out.color is None and out.weight_unit is None
+
+def test_get_matches_to_dict():
+    rec = {"title": "Zapatos rojo 1.5kg", "marca": "nike", "precio": 10, "barcode": "7891234567895"}
+    out = enrich_record(rec)
+    full = out.to_dict()
+    for field in list(full) + ["missing"]:
+        assert (field in out) == (field in full)
+        assert out.get(field) == full.get(field)
@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.file_reader import read_csv, read_feather, read_parquet
+from src.file_writer import write_output
+from src.mapper import apply_mapping
+
+SAMPLE = "samples/productos_muestra.csv"
+
+def test_arrow_csv_matches_default_engine():
+    default = read_csv(SAMPLE)
+    arrow = read_csv(SAMPLE, engine="arrow")
+    assert isinstance(arrow["Nombre"].dtype, pd.ArrowDtype)
+    assert arrow["Nombre"].tolist() == default["Nombre"].tolist()
+    assert arrow["Stock"].tolist() == default["Stock"].tolist()
+
+def test_arrow_frame_feeds_mapper():
+    df = read_csv(SAMPLE, engine="arrow")
+    out = apply_mapping(df, {"Nombre": "title", "Precio": "price"}, ["title", "price", "stock"])
+    assert len(out) == len(df)
+    assert out.loc[0, "title"] == "iPhone 14 Pro"
+
+@pytest.mark.parametrize("ext,reader", [(".parquet", read_parquet), (".feather", read_feather)])
+def test_columnar_output_roundtrip(tmp_path, ext, reader):
+    df = read_csv(SAMPLE)
+    path = str(tmp_path / ("out" + ext))
+    write_output(df, path)
+    back = reader(path)
+    assert back["Nombre"].tolist() == df["Nombre"].tolist()
+    assert back["Precio"].tolist() == df["Precio"].astype("string").tolist()
+
+@pytest.mark.parametrize("ext,reader", [(".parquet", read_parquet), (".feather", read_feather)])
+def test_mapped_output_with_missing_number(tmp_path, ext, reader):
+    data = pd.DataFrame({"title": ["Mesa roja 2kg", "Silla"], "precio": [10.5, None]})
+    mapping = {"title": "Titulo", "precio": "Precio", "weight": "Peso"}
+    out = apply_mapping(data, mapping, ["Titulo", "Precio", "Peso", "Stock"])
+    path = str(tmp_path / ("out" + ext))
+    write_output(out, path)
+    back = reader(path)
+    assert back.columns.tolist() == ["Titulo", "Precio", "Peso", "Stock"]
+    assert back["Precio"].tolist() == ["10.5", ""]
+    assert back["Peso"].tolist() == ["2.0", ""]
+    assert back["Stock"].tolist() == ["", ""]
+
+def test_unsupported_output_format(tmp_path):
+    with pytest.raises(ValueError):
+        write_output(pd.DataFrame(), str(tmp_path / "out.json"))
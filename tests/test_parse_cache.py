@@ -0,0 +1,102 @@
+import docx
+import pandas as pd
+
+from src import file_reader, parse_cache
+from src.parse_cache import ParseCache
+
+def write_xlsx(path, names):
+    pd.DataFrame({"Nombre": names, "Precio": [10.5] * len(names)}).to_excel(path, index=False)
+
+def test_xlsx_second_read_skips_parsing(tmp_path, monkeypatch):
+    src = tmp_path / "catalogo.xlsx"
+    write_xlsx(src, ["Mesa", "Silla"])
+    cache = ParseCache(str(tmp_path / "cache"))
+    first = file_reader.read_excel(str(src), cache=cache)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed again")
+    monkeypatch.setattr(file_reader.pd, "read_excel", fail)
+    second = file_reader.read_excel(str(src), cache=cache)
+    pd.testing.assert_frame_equal(first, second)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_changed_content_is_a_miss(tmp_path):
+    src = tmp_path / "catalogo.xlsx"
+    cache = ParseCache(str(tmp_path / "cache"))
+    write_xlsx(src, ["Mesa"])
+    file_reader.read_excel(str(src), cache=cache)
+    write_xlsx(src, ["Mesa", "Lampara"])
+    assert len(file_reader.read_excel(str(src), cache=cache)) == 2
+    assert cache.misses == 2
+
+def test_docx_paragraphs_cached(tmp_path):
+    src = tmp_path / "lista.docx"
+    doc = docx.Document()
+    doc.add_paragraph("Auriculares Sony")
+    doc.add_paragraph("Licuadora 1.5kg")
+    doc.save(str(src))
+    cache = ParseCache(str(tmp_path / "cache"))
+    assert file_reader.read_docx(str(src), cache=cache) == "Auriculares Sony\nLicuadora 1.5kg"
+    assert file_reader.read_docx(str(src), cache=cache) == "Auriculares Sony\nLicuadora 1.5kg"
+    assert cache.hits == 1
+
+def test_eviction_keeps_cache_under_budget(tmp_path):
+    cache = ParseCache(str(tmp_path / "cache"), max_bytes=3000)
+    for i in range(10):
+        src = tmp_path / f"f{i}.txt"
+        src.write_text(str(i))
+        cache.pages(str(src), "pdf", lambda: ["x" * 1000])
+    sizes = [p.stat().st_size for p in (tmp_path / "cache").iterdir()]
+    assert sum(sizes) <= 3000
+    assert len(sizes) >= 1
+
+def test_frames_cached_as_parquet_with_original_labels(tmp_path):
+    src = tmp_path / "numeros.xlsx"
+    pd.DataFrame({2023: [1, 2], "Nombre": ["a", "b"]}).to_excel(src, index=False)
+    cache = ParseCache(str(tmp_path / "cache"))
+    first = file_reader.read_excel(str(src), cache=cache)
+    second = file_reader.read_excel(str(src), cache=cache)
+    assert list(second.columns) == [2023, "Nombre"]
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(second, pd.read_excel(src))
+    assert all(p.suffix == ".parquet" for p in (tmp_path / "cache").iterdir())
+
+def test_mixed_type_column_cached(tmp_path):
+    src = tmp_path / "codigos.xlsx"
+    pd.DataFrame({"Codigo": [123, "A-55", None], "Precio": [1.5, 2.0, 3.0]}).to_excel(src, index=False)
+    cache = ParseCache(str(tmp_path / "cache"))
+    first = file_reader.read_excel(str(src), cache=cache)
+    second = file_reader.read_excel(str(src), cache=cache)
+    assert cache.hits == 1
+    assert second["Codigo"].tolist()[:2] == [123, "A-55"]
+    pd.testing.assert_frame_equal(first, second)
+
+def test_unstorable_frame_is_not_cached(tmp_path):
+    src = tmp_path / "f.bin"
+    src.write_bytes(b"x")
+    cache = ParseCache(str(tmp_path / "cache"))
+    df = cache.frame(str(src), "xlsx", lambda: pd.DataFrame({"a": [object()]}))
+    assert len(df) == 1
+    assert cache.store_failures == 1
+    assert not (tmp_path / "cache").exists() or not list((tmp_path / "cache").iterdir())
+
+def test_pages_store_failure_returns_result(tmp_path):
+    src = tmp_path / "f.pdf"
+    src.write_bytes(b"x")
+    blocker = tmp_path / "cache"
+    blocker.write_text("not a directory")
+    cache = ParseCache(str(blocker))
+    assert cache.pages(str(src), "pdf", lambda: ["hoja"]) == ["hoja"]
+    assert cache.store_failures == 1
+
+def test_entry_evicted_during_lookup_is_a_miss(tmp_path, monkeypatch):
+    src = tmp_path / "f.pdf"
+    src.write_bytes(b"x")
+    cache = ParseCache(str(tmp_path / "cache"))
+    cache.pages(str(src), "pdf", lambda: ["hoja"])
+
+    def evicted(path):
+        raise FileNotFoundError(path)
+    monkeypatch.setattr(parse_cache.os, "utime", evicted)
+    assert cache.pages(str(src), "pdf", lambda: ["nueva"]) == ["nueva"]
+    assert (cache.hits, cache.misses) == (0, 2)
@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+
+from src.pipeline import MemoryGovernor, run_pipeline
+
+MAPPING = {"titulo": "title", "brand": "brand", "precio": "price"}
+TEMPLATE = ["title", "brand", "price"]
+
+def catalog(n):
+    return pd.DataFrame({
+        "titulo": [f"Auriculares negro {i}" for i in range(n)],
+        "marca": ["sony"] * n,
+        "precio": [float(i) for i in range(n)],
+    })
+
+def test_governor_sizes_chunks_to_budget():
+    gov = MemoryGovernor(100_000_000, in_flight=4, initial_rows=500, min_rows=10,
+                         max_rows=10**9, headroom=1.0, rss_func=lambda: 20_000_000)
+    assert gov.chunk_rows() == 500
+    gov.observe(1000, 1000 * 1000)
+    assert gov.chunk_rows() == 20_000
+    gov.observe(100, 100 * 4000)
+    assert gov.chunk_rows() == 5_000
+
+def test_governor_backs_off_over_budget():
+    rss = [10_000_000]
+    gov = MemoryGovernor(100_000_000, in_flight=1, min_rows=1, max_rows=10**9,
+                         headroom=0.5, rss_func=lambda: rss[0])
+    gov.observe(10, 10_000)
+    normal = gov.chunk_rows()
+    rss[0] = 60_000_000
+    assert gov.chunk_rows() == normal // 2
+
+def test_pipeline_writes_all_rows_in_order(tmp_path):
+    src = tmp_path / "catalogo.csv"
+    catalog(2500).to_csv(src, index=False)
+    out = tmp_path / "salida.csv"
+    stats = run_pipeline(str(src), MAPPING, TEMPLATE, str(out), memory_budget=2 * 1024 ** 3,
+                         workers=3, initial_rows=300)
+    result = pd.read_csv(out)
+    assert stats["rows"] == len(result) == 2500
+    assert result["price"].tolist() == [float(i) for i in range(2500)]
+    assert (result["brand"] == "Sony").all()
+    assert stats["row_bytes"] > 0
+    assert stats["chunk_sizes"][0] == 300
+
+def test_pipeline_adapts_chunk_size(tmp_path):
+    out = tmp_path / "salida.parquet"
+    pytest.importorskip("pyarrow")
+    gov = MemoryGovernor(10_000_000, in_flight=2, initial_rows=50, min_rows=10,
+                         headroom=1.0, rss_func=lambda: 0)
+    stats = run_pipeline(catalog(3000), MAPPING, TEMPLATE, str(out), memory_budget=10_000_000,
+                         governor=gov)
+    assert stats["chunk_sizes"][0] == 50
+    assert max(stats["chunk_sizes"]) > 50
+    assert len(pd.read_parquet(out)) == 3000
+
+def test_pipeline_propagates_errors(tmp_path):
+    def broken(n_rows):
+        raise RuntimeError("read failed")
+    with pytest.raises(RuntimeError):
+        run_pipeline(broken, MAPPING, TEMPLATE, str(tmp_path / "x.csv"), memory_budget=10**9)
+
+@pytest.mark.parametrize("first,later", [("Mesa 2kg", "Silla"), ("Silla", "Mesa 2kg")])
+def test_parquet_chunks_with_different_column_types(tmp_path, first, later):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"titulo": [first] * 50 + [later] * 50})
+    out = tmp_path / "salida.parquet"
+    gov = MemoryGovernor(10**9, initial_rows=50, min_rows=50, max_rows=50, rss_func=lambda: 0)
+    run_pipeline(df, {"titulo": "title", "weight": "weight"}, ["title", "weight", "price"], str(out),
+                 memory_budget=10**9, governor=gov)
+    result = pd.read_parquet(out)
+    weights = dict(zip(result["title"], result["weight"]))
+    assert weights == {"Mesa 2kg": "2.0", "Silla": ""}
+    assert (result["price"] == "").all()
+    assert len(result) == 100
+
+def test_csv_output_independent_of_chunk_size(tmp_path):
+    src = tmp_path / "catalogo.csv"
+    src.write_text("titulo,marca,precio\nMesa,sony,\n" + "Silla,sony,10\n" * 5)
+    outputs = []
+    for rows in (1, 4):
+        out = tmp_path / f"salida_{rows}.csv"
+        gov = MemoryGovernor(10**9, initial_rows=rows, min_rows=rows, max_rows=rows)
+        run_pipeline(str(src), MAPPING, TEMPLATE, str(out), memory_budget=10**9, governor=gov)
+        outputs.append(out.read_text())
+    assert outputs[0] == outputs[1]
+    assert outputs[0].splitlines()[1:3] == ["Mesa,Sony,", "Silla,Sony,10"]
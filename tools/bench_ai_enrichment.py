@@ -0,0 +1,69 @@
+"""
+Benchmark the AI enrichment client against the local stub backend.
+
+Reports throughput, request count and cache hit rate for a cold run and a
+warm (cached) run. No network access or API key is needed.
+
+Usage:
+    python tools/bench_ai_enrichment.py --rows 20000 --latency 0.05
+    python tools/bench_ai_enrichment.py --http   # go through the HTTP stub server
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ai import EnrichmentClient, HTTPBackend, ResponseCache, StubBackend, enrich_records  # noqa: E402
+from src.ai.stub_server import start_stub_server  # noqa: E402
+from tools.bench_catalog import make_rows  # noqa: E402
+
+
+def run_once(label, rows, backend, cache, args):
+    client = EnrichmentClient(
+        backend, cache=cache, batch_size=args.batch_size,
+        max_concurrency=args.concurrency, rate_limit=args.rate_limit,
+    )
+    start = time.perf_counter()
+    asyncio.run(enrich_records(rows, client, modes={'description'}, enable_ai=True))
+    elapsed = time.perf_counter() - start
+
+    stats = client.stats
+    print(f"{label}: {len(rows)} rows in {elapsed:.3f}s "
+          f"({len(rows) / elapsed:,.0f} rows/s), unique={stats['unique']}, "
+          f"requests={stats['requests']}, cache_hit_rate={cache.hit_rate:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--latency', type=float, default=0.05, help='simulated seconds per request')
+    parser.add_argument('--batch-size', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--rate-limit', type=float, default=None)
+    parser.add_argument('--http', action='store_true', help='use the HTTP stub server')
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    server = None
+    if args.http:
+        server, url = start_stub_server(latency=args.latency)
+        backend = HTTPBackend(url)
+    else:
+        backend = StubBackend(latency=args.latency)
+
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            run_once("cold", rows, backend, ResponseCache(cache_dir, backend.name), args)
+            run_once("warm", rows, backend, ResponseCache(cache_dir, backend.name), args)
+    finally:
+        if server is not None:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Synthetic supplier catalog used by the benchmark scripts in tools/.
+
+Real supplier files are very repetitive: a handful of categories, brands,
+colors and weight specs shared by thousands of rows. The generator mimics
+that so benchmarks exercise realistic cardinality.
+"""
+
+import random
+
+CATEGORIES = ['Celulares', 'Audio', 'Hogar', 'Deportes', 'Herramientas', 'Juguetes']
+BRANDS = ['samsung', 'SONY', 'apple', 'Philips', 'bosch  ', 'LEGO', 'Nike', 'xiaomi']
+COLORS = ['negro', 'blanco', 'rojo', 'azul', 'gris', 'verde', 'black', 'white']
+WEIGHTS = ['250 g', '1.5kg', '2 kilos', '500gr', '1 lb', '12 oz', '3kg']
+PRODUCTS = ['Auriculares', 'Smartphone', 'Licuadora', 'Pelota', 'Taladro', 'Bloques', 'Zapatillas']
+
+
+def ean13(seed):
+    """Build a valid EAN-13 from an integer seed."""
+    digits = [int(d) for d in f"{seed % 10 ** 12:012d}"]
+    total = sum(d * (3 if i % 2 else 1) for i, d in enumerate(digits))
+    return ''.join(map(str, digits)) + str((10 - total % 10) % 10)
+
+
+def make_rows(n_rows, seed=0):
+    """
+    Generate catalog rows as dictionaries.
+
+    Args:
+        n_rows (int): Number of rows
+        seed (int): Random seed, so runs are reproducible
+
+    Returns:
+        list: Product data dictionaries
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n_rows):
+        product = rng.choice(PRODUCTS)
+        brand = rng.choice(BRANDS)
+        color = rng.choice(COLORS)
+        rows.append({
+            'titulo': f"{product} {brand.strip().title()} {color}",
+            'marca': brand,
+            'categoria': rng.choice(CATEGORIES),
+            'descripcion': f"{product} color {color}, peso {rng.choice(WEIGHTS)}",
+            'codigo': f"sku {i:07d}",
+            'codigos_de_barra': ean13(7790000000000 + rng.randrange(5000)),
+            'precio': round(rng.uniform(1000, 90000), 2),
+            'stock': rng.randrange(0, 200),
+        })
+    return rows
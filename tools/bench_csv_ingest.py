@@ -0,0 +1,86 @@
+"""
+Compare CSV parse time and peak RSS: pandas C engine vs pyarrow, and
+re-reading the same data from memory-mapped Parquet/Feather.
+
+Each measurement runs in a fresh subprocess so peak RSS is not shared.
+
+Usage:
+    python tools/bench_csv_ingest.py --rows 500000
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MODES = ['csv-pandas', 'csv-arrow', 'parquet', 'feather']
+
+
+def peak_rss_mib():
+    # VmHWM is reset on exec; ru_maxrss would include the parent's peak.
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(mode, path):
+    from src import file_reader
+
+    start = time.perf_counter()
+    if mode == 'csv-pandas':
+        df = file_reader.read_csv(path)
+    elif mode == 'csv-arrow':
+        df = file_reader.read_csv(path, engine='arrow')
+    elif mode == 'parquet':
+        df = file_reader.read_parquet(path)
+    else:
+        df = file_reader.read_feather(path)
+    elapsed = time.perf_counter() - start
+    peak = peak_rss_mib()
+    print(f"{mode:11s} rows={len(df)} parse={elapsed:.3f}s peak_rss={peak:.0f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=500000)
+    parser.add_argument('--child', nargs=2, metavar=('MODE', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    import pandas as pd
+    from src.file_writer import write_output
+    from tools.bench_catalog import make_rows
+
+    with tempfile.TemporaryDirectory() as tmp:
+        df = pd.DataFrame(make_rows(args.rows))
+        paths = {
+            'csv-pandas': os.path.join(tmp, 'catalog.csv'),
+            'parquet': os.path.join(tmp, 'catalog.parquet'),
+            'feather': os.path.join(tmp, 'catalog.feather'),
+        }
+        paths['csv-arrow'] = paths['csv-pandas']
+        write_output(df, paths['csv-pandas'])
+        write_output(df, paths['parquet'])
+        write_output(df, paths['feather'])
+        del df
+
+        for mode in MODES:
+            subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode, paths[mode]], check=True)
+
+
+if __name__ == '__main__':
+    main()
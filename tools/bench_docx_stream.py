@@ -0,0 +1,74 @@
+"""
+Peak Python memory when reading DOCX price lists: python-docx object
+model versus the streaming reader, for growing table sizes.
+
+Usage:
+    python tools/bench_docx_stream.py --rows 2000 8000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import docx  # noqa: E402
+
+from src.docx_stream import iter_docx_tables  # noqa: E402
+from tools.bench_catalog import make_rows  # noqa: E402
+
+
+def make_docx(path, n_rows):
+    rows = make_rows(n_rows)
+    columns = list(rows[0])
+    doc = docx.Document()
+    doc.add_paragraph("Lista de precios")
+    table = doc.add_table(rows=n_rows + 1, cols=len(columns))
+    for j, name in enumerate(columns):
+        table.cell(0, j).text = name
+    for i, row in enumerate(rows, start=1):
+        cells = table.rows[i].cells
+        for j, name in enumerate(columns):
+            cells[j].text = str(row[name])
+    doc.save(path)
+
+
+def measure(label, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:12s} {elapsed:7.2f}s peak={peak / 1024 / 1024:7.1f} MiB")
+
+
+def python_docx_tables(path):
+    doc = docx.Document(path)
+    return [[cell.text for cell in row.cells] for table in doc.tables for row in table.rows]
+
+
+def streaming_tables(path):
+    for _chunk in iter_docx_tables(path, chunk_size=1000):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[2000, 8000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in args.rows:
+            path = os.path.join(tmp, f"lista_{n_rows}.docx")
+            make_docx(path, n_rows)
+            print(f"rows={n_rows} size={os.path.getsize(path) / 1024:.0f} KiB")
+            measure("python-docx", lambda: python_docx_tables(path))
+            measure("streaming", lambda: streaming_tables(path))
+
+
+if __name__ == '__main__':
+    main()
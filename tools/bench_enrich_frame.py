@@ -0,0 +1,43 @@
+"""
+Compare row-by-row enrichment with factorized frame enrichment.
+
+Usage:
+    python tools/bench_enrich_frame.py --rows 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from src.enrichment import apply_enrichments, enrich_frame  # noqa: E402
+from tools.bench_catalog import make_rows  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    df = pd.DataFrame(rows)
+
+    start = time.perf_counter()
+    for row in rows:
+        apply_enrichments(row)
+    row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    enrich_frame(df)
+    frame_time = time.perf_counter() - start
+
+    print(f"rows={args.rows} row-by-row={row_time:.3f}s frame={frame_time:.3f}s "
+          f"speedup={row_time / frame_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
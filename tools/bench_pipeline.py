@@ -0,0 +1,73 @@
+"""
+Run the chunked pipeline on a synthetic catalog under a memory budget and
+report throughput, chunk sizes and peak RSS.
+
+Usage:
+    python tools/bench_pipeline.py --rows 500000 --budget-mb 400
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from src.pipeline import run_pipeline  # noqa: E402
+from tools.bench_catalog import make_rows  # noqa: E402
+
+MAPPING = {'titulo': 'title', 'precio': 'price', 'stock': 'stock', 'categoria': 'category',
+           'brand': 'brand', 'color': 'color', 'weight': 'weight', 'ean': 'ean', 'sku': 'sku'}
+TEMPLATE = list(MAPPING.values())
+
+
+def peak_rss_mib():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+    return float('nan')
+
+
+def make_csv(path, n_rows):
+    for start in range(0, n_rows, 50000):
+        rows = make_rows(min(50000, n_rows - start), seed=start)
+        pd.DataFrame(rows).to_csv(path, mode='a' if start else 'w', header=not start, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--make', metavar='PATH', help=argparse.SUPPRESS)
+    parser.add_argument('--rows', type=int, default=500000)
+    parser.add_argument('--budget-mb', type=int, default=400)
+    parser.add_argument('--workers', type=int, default=2)
+    args = parser.parse_args()
+
+    if args.make:
+        make_csv(args.make, args.rows)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, 'catalog.csv')
+        # Build the input in a child process so it does not set our peak RSS.
+        subprocess.run([sys.executable, os.path.abspath(__file__), '--make', src,
+                        '--rows', str(args.rows)], check=True)
+
+        start = time.perf_counter()
+        stats = run_pipeline(src, MAPPING, TEMPLATE, os.path.join(tmp, 'out.csv'),
+                             memory_budget=args.budget_mb * 1024 * 1024, workers=args.workers)
+        elapsed = time.perf_counter() - start
+
+    sizes = stats['chunk_sizes']
+    print(f"rows={stats['rows']} time={elapsed:.2f}s ({stats['rows'] / elapsed:,.0f} rows/s)")
+    print(f"chunks={stats['chunks']} first={sizes[0]} max={max(sizes)} "
+          f"row_bytes={stats['row_bytes']:.0f}")
+    print(f"budget={args.budget_mb} MiB peak_rss={peak_rss_mib():.0f} MiB")
+
+
+if __name__ == '__main__':
+    main()
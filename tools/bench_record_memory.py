@@ -0,0 +1,60 @@
+"""
+Measure memory held by enriched products: chained enhance_* dicts versus
+compact ProductRecord objects, plus the enriched DataFrame.
+
+Usage:
+    python tools/bench_record_memory.py --rows 200000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from src.enrichment import (  # noqa: E402
+    enhance_brand, enhance_color, enhance_ean, enhance_sku, enhance_weight, enrich_frame, enrich_record,
+)
+from tools.bench_catalog import make_rows  # noqa: E402
+
+
+def chained(row):
+    return enhance_ean(enhance_weight(enhance_color(enhance_sku(enhance_brand(row)))))
+
+
+def held_bytes(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    mib = 1024 * 1024
+
+    dict_bytes = held_bytes(lambda: [chained(row) for row in rows])
+    record_bytes = held_bytes(lambda: [enrich_record(row) for row in rows])
+    print(f"rows={args.rows}")
+    print(f"  enriched dicts:   {dict_bytes / mib:8.1f} MiB")
+    print(f"  ProductRecord:    {record_bytes / mib:8.1f} MiB ({dict_bytes / record_bytes:.1f}x smaller)")
+
+    df = pd.DataFrame(rows)
+    frame = enrich_frame(df)
+    added = frame.memory_usage(deep=True).sum() - df.memory_usage(deep=True).sum()
+    print(f"  enrich_frame added columns: {added / mib:8.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()